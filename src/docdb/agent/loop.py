@@ -15,7 +15,7 @@ Two things the loop owns beyond plain dispatch:
 
 * **Citation collection** — every tool result is scanned for
   ``document_id`` keys (nested or flat). Those IDs are unique-ified
-  and resolved via ``get_document`` so the caller gets a list of
+  and resolved via ``get_citations`` so the caller gets a list of
   ``Citation`` objects regardless of whether the LLM remembered to
   cite them in prose.
 * **Trace** — one ``AgentTrace`` record per tool call, with the
@@ -26,6 +26,7 @@ Two things the loop owns beyond plain dispatch:
 from __future__ import annotations
 
 import json
+import logging
 from dataclasses import dataclass, field
 from typing import Any, Iterable
 
@@ -33,9 +34,11 @@ from docdb.agent.toolbox import Toolbox
 from docdb.llm.base import LLMProtocol
 from docdb.llm.prompts import AGENT_SYSTEM
 from docdb.models import Citation
-from docdb.search.direct import get_document
+from docdb.search.direct import get_citations
 
 
+logger = logging.getLogger(__name__)
+
 # ---------------------------------------------------------------------------
 # Output records
 # ---------------------------------------------------------------------------
@@ -86,13 +89,13 @@ class SearchAgent:
         trace: list[AgentTrace] = []
         cited_doc_ids: list[str] = []  # ordered, deduplicated
         seen_doc_ids: set[str] = set()
+        tools = self.toolbox.openai_tools()
 
         for iteration in range(1, self.max_iters + 1):
             try:
-                response = self.llm.chat_with_tools(
-                    messages, tools=self.toolbox.openai_tools()
-                )
+                response = self.llm.chat_with_tools(messages, tools=tools)
             except Exception as exc:  # noqa: BLE001
+                logger.warning("agent chat failed at iteration %d: %s", iteration, exc)
                 return AgentResult(
                     question=question,
                     iterations=iteration - 1,
@@ -132,6 +135,11 @@ class SearchAgent:
 
             for call in tool_calls:
                 inv = self.toolbox.invoke(call.function.name, call.function.arguments)
+                logger.debug(
+                    "iteration %d: %s(%s) -> %s",
+                    iteration, call.function.name, call.function.arguments,
+                    "ok" if inv.succeeded else inv.error,
+                )
                 preview = (
                     inv.result_json
                     if inv.succeeded and inv.result_json is not None
@@ -186,21 +194,7 @@ class SearchAgent:
 
     # ------------------------------------------------------------------
     def _resolve_citations(self, doc_ids: list[str]) -> list[Citation]:
-        out: list[Citation] = []
-        for doc_id in doc_ids:
-            doc = get_document(self.toolbox.conn, doc_id)
-            if doc is None:
-                continue
-            out.append(
-                Citation(
-                    document_id=doc.id,
-                    title=doc.title,
-                    snippet=(doc.summary or doc.raw_text or "")[:160] or None,
-                    source_path=doc.source_path,
-                    doc_type=doc.doc_type,
-                )
-            )
-        return out
+        return get_citations(self.toolbox.conn, doc_ids)
 
 
 # ---------------------------------------------------------------------------
@@ -25,12 +25,14 @@ from dataclasses import dataclass, field
 from typing import Any, Callable
 
 from docdb.llm.base import LLMProtocol
-from docdb.models import Citation, Document
+from docdb.models import Citation
 from docdb.search import direct
 from docdb.search.hybrid import hybrid_search
 from docdb.search.sql_guard import UnsafeQueryError, validate_readonly_sql
-from docdb.search.text2sql import ALLOWED_TABLES, run_text2sql
+from docdb.search.text2sql import ALLOWED_TABLES, fetch_type_registry, run_text2sql
 from docdb.typing.registry import (
+    EntityTypeDef,
+    RelationTypeDef,
     get_entity_type,
     get_relation_type,
     list_entity_types,
@@ -90,6 +92,8 @@ class Toolbox:
         query_resolution_enabled: bool = True,
         query_resolution_top_k: int = 15,
         query_resolution_distance: float = 0.55,
+        hybrid_fts_weight: float = 1.0,
+        hybrid_vec_weight: float = 1.0,
     ) -> None:
         self.conn = conn
         self.llm = llm
@@ -100,14 +104,30 @@ class Toolbox:
         self.query_resolution_enabled = query_resolution_enabled
         self.query_resolution_top_k = query_resolution_top_k
         self.query_resolution_distance = query_resolution_distance
+        self.hybrid_fts_weight = hybrid_fts_weight
+        self.hybrid_vec_weight = hybrid_vec_weight
         self._specs, self._handlers = self._build()
+        # The tool schema is static for the Toolbox's lifetime; render it
+        # once so every agent turn sends a byte-identical payload (which
+        # also keeps Ollama's prompt-prefix cache warm across turns).
+        self._openai_tools = [s.to_openai() for s in self._specs]
+        # search_documents results keyed by normalised arguments. A Toolbox
+        # lives for one agent run, during which the corpus is read-only, so
+        # entries never go stale; small models routinely re-issue the same
+        # search on consecutive iterations.
+        self._search_cache: dict[tuple, list[dict]] = {}
+        # Type registry for the text_to_sql prompt, fetched on first use
+        # and reused for the rest of the run for the same reason.
+        self._type_registry: (
+            tuple[list[EntityTypeDef], list[RelationTypeDef]] | None
+        ) = None
 
     # -- Public surface ----------------------------------------------------
     def specs(self) -> list[ToolSpec]:
         return list(self._specs)
 
     def openai_tools(self) -> list[dict]:
-        return [s.to_openai() for s in self._specs]
+        return list(self._openai_tools)
 
     def invoke(self, name: str, arguments_json: str | dict) -> ToolInvocation:
         """Dispatch ``name`` with parsed ``arguments_json``.
@@ -274,6 +294,12 @@ class Toolbox:
         hybrid: bool = True,
     ) -> list[dict]:
         top_k = min(int(top_k), self.max_results)
+        cache_key = (
+            " ".join(query.split()), top_k, doc_type, date_from, date_to, bool(hybrid)
+        )
+        if (cached := self._search_cache.get(cache_key)) is not None:
+            return [dict(r) for r in cached]
+
         embedding: list[float] | None = None
         if hybrid:
             try:
@@ -289,6 +315,8 @@ class Toolbox:
                 doc_type=doc_type,
                 date_from=date_from,
                 date_to=date_to,
+                fts_weight=self.hybrid_fts_weight,
+                vec_weight=self.hybrid_vec_weight,
             )
         else:
             hits = direct.search(
@@ -299,7 +327,11 @@ class Toolbox:
                 date_from=date_from,
                 date_to=date_to,
             )
-        return [_citation_to_dict(c) for c in hits]
+        results = [_citation_to_dict(c) for c in hits]
+        # Don't pin an FTS-only fallback: the embedder may be back next call.
+        if not hybrid or embedding is not None:
+            self._search_cache[cache_key] = results
+        return [dict(r) for r in results]
 
     def _find_similar(self, document_id: str, top_k: int = 5) -> list[dict]:
         top_k = min(int(top_k), self.max_results)
@@ -309,8 +341,9 @@ class Toolbox:
         ]
 
     def _get_document(self, document_id: str) -> dict | None:
-        doc = direct.get_document(self.conn, document_id)
-        return _document_to_dict(doc) if doc else None
+        return direct.get_document_preview(
+            self.conn, document_id, max_chars=_RAW_TEXT_PREVIEW_CHARS
+        )
 
     def _describe_schema(
         self,
@@ -389,6 +422,9 @@ class Toolbox:
         ]
 
     def _text_to_sql(self, question: str) -> dict:
+        if self._type_registry is None:
+            self._type_registry = fetch_type_registry(self.conn)
+        entity_types, relation_types = self._type_registry
         result = run_text2sql(
             self.conn,
             question,
@@ -399,6 +435,8 @@ class Toolbox:
             resolution_enabled=self.query_resolution_enabled,
             resolution_top_k=self.query_resolution_top_k,
             resolution_distance_threshold=self.query_resolution_distance,
+            entity_types=entity_types,
+            relation_types=relation_types,
         )
         payload: dict = {
             "sql": result.validated_sql or result.sql,
@@ -443,9 +481,5 @@ def _citation_to_dict(c: Citation) -> dict:
     }
 
 
-def _document_to_dict(d: Document) -> dict:
-    payload = d.model_dump()
-    # raw_text can be large; the agent rarely needs more than a snippet.
-    if payload.get("raw_text") and len(payload["raw_text"]) > 2000:
-        payload["raw_text"] = payload["raw_text"][:2000] + "\n[... truncated ...]"
-    return payload
+# raw_text can be large; the agent rarely needs more than a snippet.
+_RAW_TEXT_PREVIEW_CHARS = 2000
@@ -14,7 +14,9 @@ Subcommands:
 
 from __future__ import annotations
 
+import itertools
 import json
+import logging
 import sys
 from pathlib import Path
 
@@ -27,11 +29,13 @@ from docdb.ingestion import (
     DocumentStore,
     IngestionPipeline,
     IngestionReport,
+    iter_source_files,
 )
 from docdb.llm.base import LLMProtocol
+from docdb.llm.cache import CachedEmbedder, EmbeddingCache, SQLiteEmbeddingCache
 from docdb.llm.client import LLM
 from docdb.llm.prompts import AGENT_SYSTEM
-from docdb.schema.connection import connection, init_db
+from docdb.schema.connection import connection, finish_bulk_write, init_db
 from docdb.search.direct import (
     count_documents,
     list_doc_types,
@@ -69,6 +73,11 @@ def _make_llm(settings: Settings) -> LLMProtocol:
 def main(ctx: click.Context, db_path: Path | None) -> None:
     """DocDB: local agentic search over a personal markdown corpus."""
     settings = _resolve_settings(db_path)
+    # No-op when the root logger is already configured (e.g. under pytest).
+    logging.basicConfig(
+        level=settings.log_level,
+        format="%(levelname)s %(name)s: %(message)s",
+    )
     ctx.ensure_object(dict)
     ctx.obj.setdefault("settings", settings)
     # llm_factory is overridable in tests via ctx.obj["llm_factory"].
@@ -87,6 +96,17 @@ def init(ctx: click.Context) -> None:
     click.echo(f"initialised {settings.db_path}")
 
 
+@main.command("clear-embed-cache")
+@click.pass_context
+def clear_embed_cache(ctx: click.Context) -> None:
+    """Empty the on-disk embedding cache used by ingest."""
+    settings: Settings = ctx.obj["settings"]
+    init_db(settings.db_path)
+    with connection(settings.db_path) as conn:
+        removed = SQLiteEmbeddingCache(conn).clear()
+    click.echo(f"removed {removed} cached embedding(s)")
+
+
 # ---------------------------------------------------------------------------
 # ingest / ingest-dir
 # ---------------------------------------------------------------------------
@@ -122,11 +142,19 @@ def ingest(ctx: click.Context, path: Path) -> None:
     with connection(settings.db_path) as conn:
         pipeline = IngestionPipeline(
             store=DocumentStore(conn),
-            llm=llm,
+            llm=CachedEmbedder(
+                llm,
+                SQLiteEmbeddingCache(conn),
+                namespace=settings.embed_cache_namespace,
+            ),
             entity_dedup_enabled=settings.entity_dedup_enabled,
             entity_dedup_distance=settings.entity_dedup_distance,
         )
         report = pipeline.ingest_file(path)
+        if report.status in ("created", "updated"):
+            finish_bulk_write(
+                conn, embed_cache_rows=settings.ingest_embed_cache_rows
+            )
     _print_report(report)
     if report.status == "error":
         sys.exit(1)
@@ -145,7 +173,7 @@ def ingest_dir(ctx: click.Context, directory: Path, glob_pattern: str) -> None:
     init_db(settings.db_path)
     llm = ctx.obj["llm_factory"](settings)
     counts: dict[str, int] = {"created": 0, "updated": 0, "skipped": 0, "error": 0}
-    targets = [p for p in sorted(directory.glob(glob_pattern)) if p.is_file()]
+    targets = iter_source_files(directory, glob_pattern)
     total = len(targets)
     click.echo(f"found {total} file(s) matching {glob_pattern} under {directory}")
     if total == 0:
@@ -153,16 +181,31 @@ def ingest_dir(ctx: click.Context, directory: Path, glob_pattern: str) -> None:
     with connection(settings.db_path) as conn:
         pipeline = IngestionPipeline(
             store=DocumentStore(conn),
-            llm=llm,
+            llm=CachedEmbedder(
+                llm,
+                SQLiteEmbeddingCache(conn),
+                namespace=settings.embed_cache_namespace,
+            ),
             entity_dedup_enabled=settings.entity_dedup_enabled,
             entity_dedup_distance=settings.entity_dedup_distance,
+            read_ahead=settings.ingest_read_ahead,
+            extract_workers=settings.extract_workers,
         )
-        for i, path in enumerate(targets, 1):
-            click.echo(f"[{i}/{total}] processing {path} ...", nl=True)
-            sys.stdout.flush()
-            report = pipeline.ingest_file(path)
+        # ``on_start`` fires in ``targets`` order even when extraction runs
+        # ahead on worker threads, so the counter stays meaningful and a
+        # stuck extraction shows which file it is on.
+        started = itertools.count(1)
+
+        def announce(source_path: str) -> None:
+            click.echo(f"[{next(started)}/{total}] processing {source_path} ...")
+
+        for report in pipeline.ingest_files(targets, on_start=announce):
             _print_report(report)
             counts[report.status] = counts.get(report.status, 0) + 1
+        if counts["created"] or counts["updated"]:
+            finish_bulk_write(
+                conn, embed_cache_rows=settings.ingest_embed_cache_rows
+            )
     click.echo(
         "\nsummary: "
         + " ".join(f"{k}={v}" for k, v in counts.items() if v)
@@ -244,11 +287,18 @@ def ask(
         toolbox = Toolbox(
             conn,
             llm,
+            embedder=CachedEmbedder(
+                llm,
+                EmbeddingCache(settings.embed_cache_size),
+                namespace=settings.embed_cache_namespace,
+            ),
             max_sql_limit=settings.sql_max_limit,
             text2sql_prompt_max_bytes=settings.text2sql_prompt_max_bytes,
             query_resolution_enabled=settings.query_resolution_enabled,
             query_resolution_top_k=settings.query_resolution_top_k,
             query_resolution_distance=settings.query_resolution_distance,
+            hybrid_fts_weight=settings.hybrid_fts_weight,
+            hybrid_vec_weight=settings.hybrid_vec_weight,
         )
         agent = SearchAgent(
             toolbox=toolbox,
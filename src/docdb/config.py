@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from functools import lru_cache
 from pathlib import Path
+from typing import Literal
+from urllib.parse import urlsplit
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -30,10 +32,36 @@ class Settings(BaseSettings):
     # length, which silently truncates our 20KB system prompt + tool defs and
     # makes small models emit token-soup. Override per request.
     num_ctx: int = Field(default=16_384, ge=2_048, le=131_072)
+    # In-process LRU over query embeddings (see docdb.llm.cache). Each
+    # bge-m3 vector is ~8KB as Python floats, so 512 entries stay well
+    # under 10MB. 0 disables the cache.
+    embed_cache_size: int = Field(default=512, ge=0, le=100_000)
+    # Upper bound on texts per /v1/embeddings request. Entity batches for
+    # long notes can run to hundreds of inputs; splitting keeps each
+    # request well inside Ollama's num_ctx-driven batch limits and the
+    # HTTP client's timeout while still amortising the round-trip.
+    embed_batch_size: int = Field(default=64, ge=1, le=2_048)
+    # Optional separate OpenAI-compatible endpoint for embeddings only
+    # (e.g. a local TEI / llama.cpp server next to the app). Unset means
+    # embeddings share ``ollama_base_url`` with extraction.
+    embed_base_url: str | None = None
+    # Rows kept in the on-disk ingest embedding cache (embedding_cache,
+    # ~4KB each for bge-m3) after each ingest; the oldest go first.
+    ingest_embed_cache_rows: int = Field(default=50_000, ge=0, le=10_000_000)
+
+    # Root log level for the CLI and the dev server. DEBUG shows per-file
+    # skip reasons during ingest and every agent tool call.
+    log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = "WARNING"
 
     db_path: Path = Path("./storage/docdb.sqlite")
     data_dir: Path = Path("./data")
 
+    # Weighted RRF for hybrid search (docdb.search.hybrid). Raise the FTS
+    # weight when exact-term matches (names, product codes) matter more
+    # than paraphrase recall. 1.0 / 1.0 is plain RRF.
+    hybrid_fts_weight: float = Field(default=1.0, ge=0.0, le=10.0)
+    hybrid_vec_weight: float = Field(default=1.0, ge=0.0, le=10.0)
+
     agent_max_iters: int = Field(default=8, ge=1, le=20)
     sql_max_limit: int = Field(default=100, ge=1, le=1000)
 
@@ -42,6 +70,13 @@ class Settings(BaseSettings):
     # small Ollama models; this flag lets the user turn it off without
     # rebuilding the type registry.
     extract_relations: bool = True
+    # Changed files read ahead of the one being ingested during ingest-dir,
+    # so disk / network-share latency overlaps the LLM calls. 0 disables.
+    ingest_read_ahead: int = Field(default=4, ge=0, le=64)
+    # Documents whose extraction call may be in flight at once during
+    # ingest-dir. Ollama serialises requests per model unless
+    # OLLAMA_NUM_PARALLEL is raised, so values above that only queue.
+    extract_workers: int = Field(default=1, ge=1, le=32)
     extraction_prompt_max_bytes: int = Field(default=30_000, ge=2_000, le=200_000)
     agent_prompt_max_bytes: int = Field(default=20_000, ge=2_000, le=150_000)
     text2sql_prompt_max_bytes: int = Field(default=30_000, ge=2_000, le=200_000)
@@ -74,6 +109,30 @@ class Settings(BaseSettings):
     query_resolution_top_k: int = Field(default=15, ge=1, le=50)
     query_resolution_distance: float = Field(default=0.85, ge=0.0, le=2.0)
 
+    @property
+    def embed_cache_namespace(self) -> str:
+        """Embedding-cache key prefix: the embed model *and* the server
+        that runs it, so pointing ``embed_base_url`` elsewhere never
+        serves vectors another server computed under the same name."""
+        url = self.embed_base_url or self.ollama_base_url
+        return f"{self.embed_model}@{_normalise_endpoint(url)}"
+
+
+_LOOPBACK_HOSTS = frozenset({"localhost", "127.0.0.1", "::1"})
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def _normalise_endpoint(url: str) -> str:
+    """Spell one server the same way however it is configured: loopback
+    aliases, host case, default ports and a trailing slash don't count."""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower() or "http"
+    host = (parts.hostname or "").lower()
+    if host in _LOOPBACK_HOSTS:
+        host = "127.0.0.1"
+    port = parts.port or _DEFAULT_PORTS.get(scheme)
+    return f"{scheme}://{host}:{port}{parts.path.rstrip('/')}"
+
 
 @lru_cache(maxsize=1)
 def get_settings() -> Settings:
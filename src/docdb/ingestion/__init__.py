@@ -14,7 +14,11 @@ from docdb.ingestion.normalizer import (
     normalize_extraction,
 )
 from docdb.ingestion.parser import Parser, ParsedDocument, Section
-from docdb.ingestion.pipeline import IngestionPipeline, IngestionReport
+from docdb.ingestion.pipeline import (
+    IngestionPipeline,
+    IngestionReport,
+    iter_source_files,
+)
 from docdb.ingestion.store import DocumentStore
 
 __all__ = [
@@ -31,5 +35,6 @@ __all__ = [
     "canonicalize_entity_name",
     "canonicalize_tag_name",
     "extract_due_date",
+    "iter_source_files",
     "normalize_extraction",
 ]
@@ -41,7 +41,9 @@ from docdb.models import (
 # ---------------------------------------------------------------------------
 # Link rows (pre-DB shape)
 # ---------------------------------------------------------------------------
-@dataclass
+# One link per mention per document; ``slots`` keeps them free of a
+# per-instance ``__dict__``.
+@dataclass(slots=True)
 class DocumentEntityLink:
     document_id: str
     entity_id: str
@@ -49,14 +51,14 @@ class DocumentEntityLink:
     contexts: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentRelationLink:
     document_id: str
     relation_id: str
     contexts: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentTagLink:
     document_id: str
     tag_id: str
@@ -64,7 +66,7 @@ class DocumentTagLink:
     source: str = "llm"
 
 
-@dataclass
+@dataclass(slots=True)
 class NormalizationDrop:
     kind: str  # 'unknown_entity_type' | 'unresolved_relation' | 'invalid_relation_type'
     reason: str
@@ -96,11 +98,12 @@ def _dedup_aliases(seq: Iterable[str]) -> list[str]:
     seen: set[str] = set()
     out: list[str] = []
     for s in seq:
-        key = canonicalize_entity_name(s).lower()
+        name = canonicalize_entity_name(s)
+        key = name.lower()
         if not key or key in seen:
             continue
         seen.add(key)
-        out.append(canonicalize_entity_name(s))
+        out.append(name)
     return out
 
 
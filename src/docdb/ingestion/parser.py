@@ -14,6 +14,7 @@ Other formats (PDF, DOCX, …) are reserved for the optional
 
 from __future__ import annotations
 
+import os
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -28,7 +29,9 @@ from docdb.models import (
 # ---------------------------------------------------------------------------
 # Data shapes
 # ---------------------------------------------------------------------------
-@dataclass(frozen=True)
+# ``slots`` drops the per-instance ``__dict__``; a parsed corpus holds one
+# ``Section`` per header, so it adds up on large notebooks.
+@dataclass(frozen=True, slots=True)
 class Section:
     header: str
     level: int  # 1..6
@@ -56,6 +59,24 @@ class ParsedDocument:
 # ---------------------------------------------------------------------------
 _HEADER_RE = re.compile(r"^(#{1,6})\s+(.+?)\s*$")
 _FRONTMATTER_RE = re.compile(r"\A---\s*\n(.*?)\n---\s*\n", re.DOTALL)
+# CommonMark code fence: up to three spaces of indent, then 3+ backticks
+# or tildes. Group 2 is the info string; a closing fence has none. A
+# backtick fence's info string may not contain backticks, so a line like
+# "```inline```" is inline code, not a fence.
+_FENCE_RE = re.compile(r"^ {0,3}(`{3,}(?=[^`]*$)|~{3,})(.*)$")
+
+# Built once at import instead of on every ``source_type_for`` call.
+_SOURCE_TYPE_BY_SUFFIX: dict[str, SourceType] = {
+    ".md": "md",
+    ".markdown": "md",
+    ".txt": "txt",
+    ".pdf": "pdf",
+    ".docx": "docx",
+    ".pptx": "pptx",
+    ".xlsx": "xlsx",
+    ".html": "html",
+    ".htm": "html",
+}
 
 # Regex TODO fallback was removed in Stage 2 along with the dedicated
 # ``todos`` table. Stage 3 reinstates per-type "deterministic extractors"
@@ -77,13 +98,21 @@ class Parser:
     def parse_file(self, path: Path | str) -> ParsedDocument:
         path = Path(path)
         text = path.read_text(encoding="utf-8")
-        source_type = _source_type_for(path)
+        source_type = source_type_for(path)
         if source_type == "md":
             return self.parse_markdown(text, source_path=str(path))
         return self.parse_text(text, source_path=str(path), source_type=source_type)
 
     # -- Markdown ----------------------------------------------------------
-    def parse_markdown(self, text: str, *, source_path: str) -> ParsedDocument:
+    def parse_markdown(
+        self,
+        text: str,
+        *,
+        source_path: str,
+        content_hash: str | None = None,
+    ) -> ParsedDocument:
+        """``content_hash`` may be passed when the caller already hashed
+        ``text`` (the pipeline does, for its skip check)."""
         frontmatter, body = _split_frontmatter(text)
         sections = list(_split_sections(body))
         title = _infer_title(frontmatter, sections, source_path)
@@ -91,7 +120,7 @@ class Parser:
             source_path=source_path,
             source_type="md",
             raw_text=text,
-            content_hash=content_hash_for(text),
+            content_hash=content_hash or content_hash_for(text),
             title=title,
             frontmatter=frontmatter,
             sections=sections,
@@ -104,13 +133,14 @@ class Parser:
         *,
         source_path: str,
         source_type: SourceType = "txt",
+        content_hash: str | None = None,
     ) -> ParsedDocument:
         title = _first_nonblank_line(text) or Path(source_path).stem
         return ParsedDocument(
             source_path=source_path,
             source_type=source_type,
             raw_text=text,
-            content_hash=content_hash_for(text),
+            content_hash=content_hash or content_hash_for(text),
             title=title,
             frontmatter={},
             sections=[Section(header=title, level=1, body=text)] if text.strip() else [],
@@ -119,20 +149,14 @@ class Parser:
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
-def _source_type_for(path: Path) -> SourceType:
-    suffix = path.suffix.lower()
-    mapping: dict[str, SourceType] = {
-        ".md": "md",
-        ".markdown": "md",
-        ".txt": "txt",
-        ".pdf": "pdf",
-        ".docx": "docx",
-        ".pptx": "pptx",
-        ".xlsx": "xlsx",
-        ".html": "html",
-        ".htm": "html",
-    }
-    return mapping.get(suffix, "txt")
+def source_type_for(path: Path | str) -> SourceType:
+    """Classify a source path by its suffix; unknown suffixes are ``txt``.
+
+    Shared with the ingestion pipeline so both entry points classify a
+    path the same way. Accepts plain strings without building a ``Path``.
+    """
+    suffix = os.path.splitext(path)[1].lower()
+    return _SOURCE_TYPE_BY_SUFFIX.get(suffix, "txt")
 
 
 def _split_frontmatter(text: str) -> tuple[dict[str, str], str]:
@@ -158,30 +182,39 @@ def _split_sections(body: str) -> Iterable[Section]:
     them without losing their position.
     """
     lines = body.splitlines()
-    current_header: str | None = None
-    current_level = 0
-    current_body: list[str] = []
-
-    for line in lines:
-        m = _HEADER_RE.match(line)
-        if m:
-            if current_header is not None or current_body:
-                yield Section(
-                    header=current_header or "__preamble__",
-                    level=current_level,
-                    body="\n".join(current_body).strip(),
-                )
-            current_header = m.group(2).strip()
-            current_level = len(m.group(1))
-            current_body = []
-        else:
-            current_body.append(line)
-
-    if current_header is not None or current_body:
+    # (line index, level, header text) per header. Bodies are sliced out of
+    # ``lines`` afterwards instead of appending every line to a per-section
+    # buffer.
+    headers: list[tuple[int, int, str]] = []
+    # Opening fence run ("```", "~~~~", ...) while inside a fenced code
+    # block; "#" lines in there are shell comments / code, not headers.
+    fence: str | None = None
+
+    for i, line in enumerate(lines):
+        if ("```" in line or "~~~" in line) and (f := _FENCE_RE.match(line)):
+            run = f.group(1)
+            if fence is None:
+                fence = run
+            elif run[0] == fence[0] and len(run) >= len(fence) and not f.group(2).strip():
+                fence = None
+        # Every ATX header starts with "#"; the prefix test rejects body
+        # lines without entering the regex engine.
+        if fence is None and line.startswith("#") and (m := _HEADER_RE.match(line)):
+            headers.append((i, len(m.group(1)), m.group(2).strip()))
+
+    first = headers[0][0] if headers else len(lines)
+    if first:
+        yield Section(
+            header="__preamble__",
+            level=0,
+            body="\n".join(lines[:first]).strip(),
+        )
+    for n, (i, level, header) in enumerate(headers):
+        end = headers[n + 1][0] if n + 1 < len(headers) else len(lines)
         yield Section(
-            header=current_header or "__preamble__",
-            level=current_level,
-            body="\n".join(current_body).strip(),
+            header=header,
+            level=level,
+            body="\n".join(lines[i + 1:end]).strip(),
         )
 
 
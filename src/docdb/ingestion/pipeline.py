@@ -5,14 +5,22 @@ Glue layer over parser → extractor → normalizer → store.
 The pipeline guarantees:
 
 * **content-hash idempotency** — re-running ingest on an unchanged file
-  returns status "skipped" without touching the DB or the LLM.
+  returns status "skipped" without touching the DB or the LLM. For
+  files, a matching ``(mtime_ns, size)`` from the last ingest skips even
+  the read and the hash.
 * **clean updates** — when a file's content changes, the old document
   rows (and its entity/tag links) are deleted before the new ones are
   written, so the corpus never accumulates stale rows from earlier
-  ingests of the same source_path.
+  ingests of the same source_path. Delete and re-insert share one
+  transaction, so a failed re-ingest keeps the previous version.
 * **graceful degradation** — an LLM failure does not break ingestion;
   the document, its raw text, and a heuristic title still land in the
   DB and the IngestionReport carries the error message.
+* **single writer** — ``ingest_files`` may read upcoming files and run
+  their LLM extraction on worker threads (``read_ahead`` /
+  ``extract_workers``), but every read and write of the store
+  connection stays on the calling thread and reports come back in input
+  order.
 
 Stage 3 reads the entity/relation type registry from the store
 connection at construction time, hands it to the ``Extractor`` to build
@@ -26,19 +34,25 @@ the run.
 
 from __future__ import annotations
 
+import fnmatch
+import logging
+import os
 import re
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterator, Literal
+from typing import Callable, Iterable, Iterator, Literal
 
-from docdb.ingestion.extractor import Extractor
+from docdb.ingestion.extractor import ExtractionOutcome, Extractor
 from docdb.ingestion.normalizer import (
     DocumentEntityLink,
     DocumentRelationLink,
     NormalizedExtraction,
     normalize_extraction,
 )
-from docdb.ingestion.parser import ParsedDocument, Parser
+from docdb.ingestion.parser import ParsedDocument, Parser, source_type_for
 from docdb.ingestion.store import DocumentStore
 from docdb.llm.base import LLMProtocol
 from docdb.models import (
@@ -59,6 +73,8 @@ from docdb.typing.registry import (
 )
 
 
+logger = logging.getLogger(__name__)
+
 Status = Literal["created", "updated", "skipped", "error"]
 
 
@@ -74,6 +90,17 @@ class IngestionReport:
     relations_added: int = 0
 
 
+# ``ingest_files`` queue entries: (source_path, text / pending read / final
+# report, stat) while reading; (parsed document / final report, stat,
+# pending extraction) while extracting.
+_QueuedRead = tuple[str, str | Future[str] | IngestionReport, os.stat_result | None]
+_QueuedExtraction = tuple[
+    ParsedDocument | IngestionReport,
+    os.stat_result | None,
+    Future[ExtractionOutcome] | None,
+]
+
+
 @dataclass
 class IngestionPipeline:
     store: DocumentStore
@@ -84,6 +111,11 @@ class IngestionPipeline:
     # Fuzzy entity dedup at ingest. See docdb.config.Settings for tuning.
     entity_dedup_enabled: bool = True
     entity_dedup_distance: float = 0.35
+    # ``ingest_files`` overlaps (see there): files read ahead of the one
+    # being ingested, and LLM extractions in flight at once. 0 / 1 keep
+    # the plain one-file-at-a-time loop.
+    read_ahead: int = 0
+    extract_workers: int = 1
 
     def __post_init__(self) -> None:
         # The registry is read once at construction. Tests that mutate the
@@ -93,6 +125,8 @@ class IngestionPipeline:
         self._relation_types = list_relation_types(self.store.conn)
         self._registry_hash = registry_hash(self.store.conn)
         self._entity_slugs = {t.slug for t in self._entity_types}
+        # Sorted once here rather than per document in _ingest_parsed.
+        self._entity_slug_list = sorted(self._entity_slugs)
         self._relation_slugs = {t.slug for t in self._relation_types}
 
         if self.extractor is None:
@@ -107,64 +141,269 @@ class IngestionPipeline:
     # Public entry points
     # ------------------------------------------------------------------
     def ingest_file(self, path: Path | str) -> IngestionReport:
-        path = Path(path)
+        prepared, st = self._prepare_file(Path(path))
+        if isinstance(prepared, ParsedDocument):
+            prepared = self._ingest_parsed(prepared)
+        return self._record_stat(prepared, st)
+
+    def ingest_text(
+        self,
+        text: str,
+        *,
+        source_path: str,
+        source_type: SourceType | None = None,
+    ) -> IngestionReport:
+        parsed = self._parse_unless_known(
+            text, source_path=source_path, source_type=source_type
+        )
+        if isinstance(parsed, IngestionReport):
+            return parsed
+        return self._ingest_parsed(parsed)
+
+    def ingest_directory(
+        self,
+        root: Path | str,
+        *,
+        glob: str = "**/*.md",
+    ) -> Iterator[IngestionReport]:
+        yield from self.ingest_files(iter_source_files(root, glob))
+
+    def ingest_files(
+        self,
+        paths: Iterable[Path | str],
+        *,
+        on_start: Callable[[str], None] | None = None,
+    ) -> Iterator[IngestionReport]:
+        """Ingest ``paths`` in order, yielding one report per path.
+
+        ``on_start(source_path)`` is called, in input order, just before
+        this thread starts (or waits on) the work that finishes a path,
+        so progress output names the file a slow extraction is stuck on.
+
+        Two optional overlaps, both on worker threads while this thread
+        keeps stat checks, parsing, embedding and every store access to
+        itself (sqlite connections are not shared across threads and the
+        store stays the only writer):
+
+        * ``read_ahead > 0`` reads the next few changed files while the
+          current one is being ingested, hiding disk / network-share
+          latency. The stat check still runs first, so unchanged files
+          are never read.
+        * ``extract_workers > 1`` runs the LLM extraction call (the bulk
+          of per-file wall time, I/O-bound on the Ollama round-trip) for
+          up to that many upcoming files at once.
+
+        Either way a file's stat and hash checks run before the files
+        queued ahead of it are written, so those decisions are
+        re-validated at completion time: a skip whose document has since
+        been replaced (taking its ``source_files`` rows with it through
+        ``ON DELETE CASCADE``) is redone, and a parsed file whose content
+        was stored in the meantime is skipped.
+        """
+        if self.read_ahead <= 0 and self.extract_workers <= 1:
+            for path in paths:
+                if on_start is not None:
+                    on_start(str(path))
+                yield self.ingest_file(path)
+            return
+
+        with ExitStack() as stack:
+            readers = (
+                stack.enter_context(ThreadPoolExecutor(
+                    max_workers=self.read_ahead, thread_name_prefix="docdb-read"
+                ))
+                if self.read_ahead > 0
+                else None
+            )
+            extractors = (
+                stack.enter_context(ThreadPoolExecutor(
+                    max_workers=self.extract_workers, thread_name_prefix="docdb-extract"
+                ))
+                if self.extract_workers > 1
+                else None
+            )
+            extract_window = self.extract_workers if extractors else 0
+            reading: deque[_QueuedRead] = deque()
+            extracting: deque[_QueuedExtraction] = deque()
+            for path in paths:
+                reading.append(self._start_read(Path(path), readers))
+                while len(reading) > self.read_ahead:
+                    extracting.append(
+                        self._start_extract(*reading.popleft(), extractors)
+                    )
+                    while len(extracting) > extract_window:
+                        yield self._complete_queued(*extracting.popleft(), on_start)
+            while reading:
+                extracting.append(self._start_extract(*reading.popleft(), extractors))
+                while len(extracting) > extract_window:
+                    yield self._complete_queued(*extracting.popleft(), on_start)
+            while extracting:
+                yield self._complete_queued(*extracting.popleft(), on_start)
+
+    # ------------------------------------------------------------------
+    # Core
+    # ------------------------------------------------------------------
+    def _prepare_file(
+        self, path: Path
+    ) -> tuple[ParsedDocument | IngestionReport, os.stat_result | None]:
+        """Stat, read and parse ``path`` unless it can be skipped.
+
+        Returns the parsed document (or the final report for a skip or a
+        read error) together with the stat to record once it is ingested.
+        """
+        source_path = str(path)
+        st = self._stat_unless_unchanged(path)
+        if isinstance(st, IngestionReport):
+            return st, None
         try:
             text = path.read_text(encoding="utf-8")
         except OSError as exc:
+            return _read_error(source_path, exc), None
+        return self._parse_unless_known(text, source_path=source_path), st
+
+    def _stat_unless_unchanged(self, path: Path) -> os.stat_result | IngestionReport:
+        source_path = str(path)
+        try:
+            # stat before reading: if the file changes in between, the
+            # recorded stat is the older one and the next run re-reads it.
+            st = path.stat()
+        except OSError as exc:
+            return _read_error(source_path, exc)
+        if unchanged := self._document_for_unchanged_source(source_path, st):
+            logger.debug("skip %s: stat unchanged (%s)", source_path, unchanged)
             return IngestionReport(
-                source_path=str(path), status="error", error=str(exc)
+                source_path=source_path,
+                status="skipped",
+                document_id=unchanged,
             )
-        return self.ingest_text(text, source_path=str(path))
+        return st
 
-    def ingest_text(
+    def _parse_unless_known(
         self,
         text: str,
         *,
         source_path: str,
         source_type: SourceType | None = None,
-    ) -> IngestionReport:
+    ) -> ParsedDocument | IngestionReport:
         h = content_hash_for(text)
         if existing := self._lookup_by_hash(h):
+            logger.debug("skip %s: content hash matches %s", source_path, existing)
             return IngestionReport(
                 source_path=source_path,
                 status="skipped",
                 document_id=existing,
             )
 
-        st = source_type or _source_type_for_path(source_path)
+        st = source_type or source_type_for(source_path)
         if st == "md":
-            parsed = self.parser.parse_markdown(text, source_path=source_path)
-        else:
-            parsed = self.parser.parse_text(text, source_path=source_path, source_type=st)
+            return self.parser.parse_markdown(
+                text, source_path=source_path, content_hash=h
+            )
+        return self.parser.parse_text(
+            text, source_path=source_path, source_type=st, content_hash=h
+        )
 
-        return self._ingest_parsed(parsed)
+    # -- ingest_files stages -------------------------------------------------
+    def _start_read(
+        self, path: Path, readers: ThreadPoolExecutor | None
+    ) -> _QueuedRead:
+        st = self._stat_unless_unchanged(path)
+        if isinstance(st, IngestionReport):
+            return str(path), st, None
+        if readers is None:
+            try:
+                return str(path), path.read_text(encoding="utf-8"), st
+            except OSError as exc:
+                return str(path), _read_error(str(path), exc), None
+        return str(path), readers.submit(path.read_text, encoding="utf-8"), st
 
-    def ingest_directory(
+    def _start_extract(
         self,
-        root: Path | str,
-        *,
-        glob: str = "**/*.md",
-    ) -> Iterator[IngestionReport]:
-        root = Path(root)
-        for path in sorted(root.glob(glob)):
-            if path.is_file():
-                yield self.ingest_file(path)
+        source_path: str,
+        text: str | Future[str] | IngestionReport,
+        st: os.stat_result | None,
+        extractors: ThreadPoolExecutor | None,
+    ) -> _QueuedExtraction:
+        if isinstance(text, IngestionReport):
+            return text, None, None
+        if isinstance(text, Future):
+            try:
+                text = text.result()
+            except OSError as exc:
+                return _read_error(source_path, exc), None, None
+        parsed = self._parse_unless_known(text, source_path=source_path)
+        if extractors is None or isinstance(parsed, IngestionReport):
+            return parsed, st, None
+        return parsed, st, extractors.submit(self.extractor.extract, parsed)
+
+    def _complete_queued(
+        self,
+        prepared: ParsedDocument | IngestionReport,
+        st: os.stat_result | None,
+        extraction: Future[ExtractionOutcome] | None,
+        on_start: Callable[[str], None] | None = None,
+    ) -> IngestionReport:
+        if on_start is not None:
+            on_start(prepared.source_path)
+        if (
+            isinstance(prepared, IngestionReport)
+            and prepared.status == "skipped"
+            and not self._document_exists(prepared.document_id)
+        ):
+            # The stat or hash check matched a document that a file queued
+            # ahead of this one has since replaced (its source_files row
+            # went with it); redo the file from scratch, as the sequential
+            # path would have.
+            prepared, st = self._prepare_file(Path(prepared.source_path))
+            extraction = None
+        if isinstance(prepared, ParsedDocument):
+            existing = (
+                self._lookup_by_hash(prepared.content_hash) if extraction else None
+            )
+            if existing:
+                # An identical file queued just ahead of this one was
+                # written after this one passed its own hash check.
+                logger.debug(
+                    "skip %s: content hash matches %s", prepared.source_path, existing
+                )
+                prepared = IngestionReport(
+                    source_path=prepared.source_path,
+                    status="skipped",
+                    document_id=existing,
+                )
+            else:
+                prepared = self._ingest_parsed(
+                    prepared, extraction.result() if extraction else None
+                )
+        return self._record_stat(prepared, st)
 
-    # ------------------------------------------------------------------
-    # Core
-    # ------------------------------------------------------------------
-    def _ingest_parsed(self, parsed: ParsedDocument) -> IngestionReport:
+    def _record_stat(
+        self, report: IngestionReport, st: os.stat_result | None
+    ) -> IngestionReport:
+        if st is not None and report.status != "error" and report.document_id:
+            self.store.record_source_stat(
+                report.source_path,
+                mtime_ns=st.st_mtime_ns,
+                size=st.st_size,
+                document_id=report.document_id,
+            )
+        return report
+
+    def _ingest_parsed(
+        self,
+        parsed: ParsedDocument,
+        outcome: ExtractionOutcome | None = None,
+    ) -> IngestionReport:
         doc_id = document_id_for(parsed.content_hash)
         is_update = self._existing_document_id_for_source(parsed.source_path) is not None
-        if is_update:
-            self.store.delete_by_source(parsed.source_path)
 
-        outcome = self.extractor.extract(parsed)
+        if outcome is None:
+            outcome = self.extractor.extract(parsed)
         result = outcome.result
 
         # Merge deterministic extractor output into the LLM-emitted entities so
         # the normaliser's dedup logic catches duplicates without special-casing.
-        det_entities = run_for_types(parsed.raw_text, sorted(self._entity_slugs))
+        det_entities = run_for_types(parsed.raw_text, self._entity_slug_list)
         _attach_deterministic_entities(result, det_entities)
 
         doc = Document(
@@ -185,6 +424,7 @@ class IngestionPipeline:
         try:
             [embedding] = self.llm.embed([embed_text])
         except Exception as exc:  # noqa: BLE001
+            logger.warning("embed failed for %s: %s", parsed.source_path, exc)
             return IngestionReport(
                 source_path=parsed.source_path,
                 status="error",
@@ -193,8 +433,6 @@ class IngestionPipeline:
                 extraction_error=outcome.error,
             )
 
-        self.store.upsert_document(doc, embedding=embedding)
-
         norm = normalize_extraction(
             result,
             document_id=doc_id,
@@ -203,17 +441,6 @@ class IngestionPipeline:
             extract_relations=self.extract_relations,
         )
 
-        # Tags
-        for tag in norm.tags:
-            self.store.upsert_tag(tag)
-        for link in norm.tag_links:
-            self.store.link_document_tag(
-                link.document_id,
-                link.tag_id,
-                confidence=link.confidence,
-                source=link.source,
-            )
-
         # Fuzzy entity dedup — embed each newly-extracted entity, find an
         # existing same-type entity within distance threshold, fold the new
         # surface form into the existing row's aliases, and remap link /
@@ -221,12 +448,16 @@ class IngestionPipeline:
         # entity. On embed failure we degrade gracefully: keep the unique-
         # constraint dedup that was always there.
         entity_embeddings: dict[str, list[float]] = {}
-        merge_targets: set[str] = set()  # existing entity ids merged into
+        merged_canonical: dict[str, list[str]] = {}
         dedup_error: str | None = None
         if self.entity_dedup_enabled and norm.entities:
             try:
                 entity_embeddings = self._embed_entities(norm.entities)
             except Exception as exc:  # noqa: BLE001
+                logger.warning(
+                    "entity embed failed for %s; dedup skipped: %s",
+                    parsed.source_path, exc,
+                )
                 dedup_error = (
                     f"entity embed failed: {type(exc).__name__}: {exc}"
                 )
@@ -237,62 +468,67 @@ class IngestionPipeline:
                     norm.entities, entity_embeddings
                 )
                 if remap:
-                    for existing_id, surface_forms in merged_canonical.items():
-                        self.store.merge_aliases_into_entity(
-                            existing_id, surface_forms
-                        )
-                        merge_targets.add(existing_id)
                     norm = _apply_entity_remap(norm, remap)
                     for merged_out_id in remap:
                         entity_embeddings.pop(merged_out_id, None)
 
-        # Entities — write each through the store so field validation runs.
+        # Every LLM / embedder round-trip is done; the writes below go out
+        # as one transaction (one commit, one WAL fsync) instead of one per
+        # row, and a failure part-way leaves the previous version of the
+        # document intact rather than half-replaced.
         per_type_counts: dict[str, int] = {}
         validation_errors: list[str] = []
-        accepted_entity_ids: set[str] = set(merge_targets)
-        for ent in norm.entities:
-            try:
-                self.store.upsert_entity(
-                    ent, embedding=entity_embeddings.get(ent.id)
-                )
-            except ValueError as exc:
-                validation_errors.append(f"entity {ent.canonical_name!r}: {exc}")
-                continue
-            per_type_counts[ent.type_slug] = per_type_counts.get(ent.type_slug, 0) + 1
-            accepted_entity_ids.add(ent.id)
-
-        for link in norm.entity_links:
-            if link.entity_id not in accepted_entity_ids:
-                continue
-            self.store.link_document_entity(
-                link.document_id,
-                link.entity_id,
-                mention_count=link.mention_count,
-                contexts=link.contexts,
-            )
-
-        # Relations — drop ones referencing entities that didn't make it,
-        # and self-loops introduced by the dedup remap.
         relations_added = 0
-        for rel in norm.relations:
-            if (
-                rel.source_entity_id not in accepted_entity_ids
-                or rel.target_entity_id not in accepted_entity_ids
-            ):
-                continue
-            if rel.source_entity_id == rel.target_entity_id:
-                continue
-            try:
-                self.store.upsert_relation(rel)
-            except ValueError as exc:
-                validation_errors.append(f"relation {rel.id}: {exc}")
-                continue
-            relations_added += 1
-        for link in norm.relation_links:
-            self.store.link_document_relation(
-                link.document_id, link.relation_id, contexts=link.contexts
+        with self.store.transaction():
+            if is_update:
+                self.store.delete_by_source(parsed.source_path)
+
+            self.store.upsert_document(doc, embedding=embedding)
+
+            # Tags
+            for tag in norm.tags:
+                self.store.upsert_tag(tag)
+            self.store.link_document_tags(norm.tag_links)
+
+            for existing_id, surface_forms in merged_canonical.items():
+                self.store.merge_aliases_into_entity(existing_id, surface_forms)
+
+            # Entities — write each through the store so field validation runs.
+            accepted_entity_ids: set[str] = set(merged_canonical)
+            for ent in norm.entities:
+                try:
+                    self.store.upsert_entity(
+                        ent, embedding=entity_embeddings.get(ent.id)
+                    )
+                except ValueError as exc:
+                    validation_errors.append(f"entity {ent.canonical_name!r}: {exc}")
+                    continue
+                per_type_counts[ent.type_slug] = per_type_counts.get(ent.type_slug, 0) + 1
+                accepted_entity_ids.add(ent.id)
+
+            self.store.link_document_entities(
+                link for link in norm.entity_links
+                if link.entity_id in accepted_entity_ids
             )
 
+            # Relations — drop ones referencing entities that didn't make it,
+            # and self-loops introduced by the dedup remap.
+            for rel in norm.relations:
+                if (
+                    rel.source_entity_id not in accepted_entity_ids
+                    or rel.target_entity_id not in accepted_entity_ids
+                ):
+                    continue
+                if rel.source_entity_id == rel.target_entity_id:
+                    continue
+                try:
+                    self.store.upsert_relation(rel)
+                except ValueError as exc:
+                    validation_errors.append(f"relation {rel.id}: {exc}")
+                    continue
+                relations_added += 1
+            self.store.link_document_relations(norm.relation_links)
+
         # Surface non-fatal extraction notes (validation drops + normaliser drops)
         # on the report so the CLI / UI can show them.
         notes: list[str] = []
@@ -320,7 +556,14 @@ class IngestionPipeline:
     def _embed_entities(self, entities) -> dict[str, list[float]]:
         """Batch-embed entities; return {entity_id: vector}.
 
-        Empty input → empty dict, no LLM call.
+        One ``embed`` call for the whole document. Re-ingesting an edited
+        note does not pay for the entities it already mentioned: the CLI
+        and server wrap ``llm`` in a ``CachedEmbedder`` over
+        ``SQLiteEmbeddingCache``, which is keyed on the embed text itself,
+        so only texts never embedded before (including any whose
+        description changed) reach the model.
+
+        Empty input → no LLM call.
         """
         if not entities:
             return {}
@@ -379,6 +622,25 @@ class IngestionPipeline:
         ).fetchone()
         return row["id"] if row else None
 
+    def _document_exists(self, document_id: str | None) -> bool:
+        row = self.store.conn.execute(
+            "SELECT 1 FROM documents WHERE id = ?", (document_id,)
+        ).fetchone()
+        return row is not None
+
+    def _document_for_unchanged_source(
+        self, source_path: str, st: os.stat_result
+    ) -> str | None:
+        """Document id if ``source_path`` still has the stat it was ingested
+        with — the make/rsync shortcut that avoids reading and hashing
+        untouched files on every ingest-dir run."""
+        row = self.store.conn.execute(
+            "SELECT document_id FROM source_files"
+            " WHERE source_path = ? AND mtime_ns = ? AND size = ?",
+            (source_path, st.st_mtime_ns, st.st_size),
+        ).fetchone()
+        return row["document_id"] if row else None
+
     def _existing_document_id_for_source(self, source_path: str) -> str | None:
         row = self.store.conn.execute(
             "SELECT id FROM documents WHERE source_path = ?", (source_path,)
@@ -386,6 +648,59 @@ class IngestionPipeline:
         return row["id"] if row else None
 
 
+def _read_error(source_path: str, exc: OSError) -> IngestionReport:
+    return IngestionReport(source_path=source_path, status="error", error=str(exc))
+
+
+# ---------------------------------------------------------------------------
+# Source discovery
+# ---------------------------------------------------------------------------
+# ``**/*.<ext>`` — the shape every caller actually passes (the CLI default
+# is ``**/*.md``). Captures the basename pattern.
+_RECURSIVE_NAME_GLOB_RE = re.compile(r"\A\*\*/([^/]+)\Z")
+
+
+def iter_source_files(root: Path | str, glob: str = "**/*.md") -> list[Path]:
+    """Sorted regular files under ``root`` matching ``glob``.
+
+    ``**/<name-pattern>`` is served by an ``os.scandir`` walk that reads
+    file-vs-directory from the directory entry itself, so unlike
+    ``Path.glob`` followed by ``Path.is_file()`` it costs no extra
+    ``stat`` per candidate file. Any other pattern falls back to
+    ``Path.glob``.
+    """
+    root = Path(root)
+    m = _RECURSIVE_NAME_GLOB_RE.match(glob)
+    if m is None or "**" in m.group(1):
+        return sorted(p for p in root.glob(glob) if p.is_file())
+    return sorted(_walk_matching(root, m.group(1)))
+
+
+def _walk_matching(root: Path, name_pattern: str) -> Iterator[Path]:
+    # Same file set as ``Path.glob("**/<pattern>")``: symlinked directories
+    # are not descended into (which also rules out symlink cycles), while
+    # symlinks to files still match.
+    # The pattern is compiled once for the walk; fnmatchcase would redo
+    # its cache lookup and wrapper call for every directory entry.
+    name_matches = re.compile(fnmatch.translate(name_pattern)).match
+    pending = [root]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(Path(entry.path))
+                elif entry.is_file() and name_matches(entry.name):
+                    yield Path(entry.path)
+            except OSError:
+                continue
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -406,17 +721,6 @@ def _creation_date_from_frontmatter(parsed: ParsedDocument) -> str | None:
     return None
 
 
-def _source_type_for_path(path: str) -> SourceType:
-    suffix = Path(path).suffix.lower()
-    if suffix in {".md", ".markdown"}:
-        return "md"
-    if suffix in {".txt", ""}:
-        return "txt"
-    if suffix == ".pdf":
-        return "pdf"
-    return "txt"
-
-
 _DOC_TYPES = {"memo", "meeting", "journal", "reference", "spec", "other"}
 
 
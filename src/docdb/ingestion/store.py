@@ -2,7 +2,10 @@
 
 DocumentStore is the only writer in the system. Everything else reads.
 Each public method runs inside a transaction so partial state (e.g. a
-document row without its embedding) cannot be observed.
+document row without its embedding) cannot be observed. Callers that
+write many rows at once (the ingest pipeline: one document plus its
+tags, entities, relations and links) wrap them in ``transaction()`` so
+the whole batch commits once instead of once per row.
 
 Property-graph note: ``upsert_entity`` validates the entity's ``fields``
 payload against the registered ``entity_types.fields_schema`` before
@@ -15,9 +18,15 @@ from __future__ import annotations
 
 import json
 import sqlite3
-import struct
-from typing import Iterable
+from array import array
+from contextlib import contextmanager
+from typing import Any, Iterable, Iterator
 
+from docdb.ingestion.normalizer import (
+    DocumentEntityLink,
+    DocumentRelationLink,
+    DocumentTagLink,
+)
 from docdb.models import (
     Document,
     Entity,
@@ -29,20 +38,77 @@ from docdb.typing.field_spec import validate_fields
 from docdb.typing.registry import get_entity_type, get_relation_type
 
 
+# Link upserts, shared by the single-row and batch (executemany) writers.
+_LINK_DOCUMENT_ENTITY_SQL = """
+    INSERT INTO document_entities (document_id, entity_id, mention_count, contexts)
+    VALUES (?,?,?,?)
+    ON CONFLICT(document_id, entity_id) DO UPDATE SET
+        mention_count = excluded.mention_count,
+        contexts      = excluded.contexts
+"""
+_LINK_DOCUMENT_RELATION_SQL = """
+    INSERT INTO document_relation_mentions (document_id, relation_id, contexts)
+    VALUES (?,?,?)
+    ON CONFLICT(document_id, relation_id) DO UPDATE SET
+        contexts = excluded.contexts
+"""
+_LINK_DOCUMENT_TAG_SQL = """
+    INSERT INTO document_tags (document_id, tag_id, confidence, source)
+    VALUES (?,?,?,?)
+    ON CONFLICT(document_id, tag_id) DO UPDATE SET
+        confidence = excluded.confidence,
+        source     = excluded.source
+"""
+
+
 def pack_embedding(vec: Iterable[float]) -> bytes:
-    """Pack a float vector into the byte layout sqlite-vec expects."""
-    floats = list(vec)
-    return struct.pack(f"{len(floats)}f", *floats)
+    """Pack a float vector into the byte layout sqlite-vec expects.
+
+    ``array("f")`` is a contiguous native float32 buffer: the same bytes as
+    ``struct.pack(f"{n}f", *vec)``, without spreading 1024 floats into a
+    varargs call or building an intermediate list.
+    """
+    return array("f", vec).tobytes()
 
 
 def unpack_embedding(blob: bytes) -> list[float]:
-    n = len(blob) // 4
-    return list(struct.unpack(f"{n}f", blob))
+    floats = array("f")
+    floats.frombytes(blob)
+    return floats.tolist()
 
 
 class DocumentStore:
     def __init__(self, conn: sqlite3.Connection) -> None:
         self.conn = conn
+        self._tx_depth = 0
+        # Registry lookups memoised for the lifetime of the outermost
+        # transaction only (see ``_type_def``).
+        self._type_defs: dict[tuple[str, str], Any] = {}
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group writes into a single commit.
+
+        The outermost call owns the transaction: it commits on success and
+        rolls back if an exception escapes. Nested calls — including the
+        one every public write method opens — join it instead of
+        committing early, so a batch is all-or-nothing and costs one
+        commit (one WAL fsync) rather than one per row.
+        """
+        if self._tx_depth:
+            self._tx_depth += 1
+            try:
+                yield
+            finally:
+                self._tx_depth -= 1
+            return
+        self._tx_depth = 1
+        try:
+            with self.conn:
+                yield
+        finally:
+            self._tx_depth = 0
+            self._type_defs.clear()
 
     # ------------------------------------------------------------------
     # Documents
@@ -52,7 +118,7 @@ class DocumentStore:
     ) -> None:
         metadata_json = json.dumps(doc.metadata or {}, ensure_ascii=False)
         now = now_iso()
-        with self.conn:
+        with self.transaction():
             self.conn.execute(
                 """
                 INSERT INTO documents (
@@ -97,23 +163,48 @@ class DocumentStore:
                 self._upsert_vec("documents_vec", "document_id", doc.id, embedding)
 
     def delete_document(self, document_id: str) -> None:
-        with self.conn:
+        with self.transaction():
             self.conn.execute("DELETE FROM documents WHERE id = ?", (document_id,))
             self.conn.execute(
                 "DELETE FROM documents_vec WHERE document_id = ?", (document_id,)
             )
 
     def delete_by_source(self, source_path: str) -> int:
-        with self.conn:
-            rows = self.conn.execute(
-                "SELECT id FROM documents WHERE source_path = ?", (source_path,)
-            ).fetchall()
-            for r in rows:
-                self.conn.execute("DELETE FROM documents WHERE id = ?", (r["id"],))
-                self.conn.execute(
-                    "DELETE FROM documents_vec WHERE document_id = ?", (r["id"],)
+        with self.transaction():
+            ids = [
+                (r["id"],)
+                for r in self.conn.execute(
+                    "SELECT id FROM documents WHERE source_path = ?", (source_path,)
                 )
-        return len(rows)
+            ]
+            if not ids:
+                return 0
+            self.conn.execute(
+                "DELETE FROM documents WHERE source_path = ?", (source_path,)
+            )
+            # vec0 only serves point lookups on its primary key; an IN
+            # (subquery) delete would scan every stored vector.
+            self.conn.executemany(
+                "DELETE FROM documents_vec WHERE document_id = ?", ids
+            )
+        return len(ids)
+
+    def record_source_stat(
+        self, source_path: str, *, mtime_ns: int, size: int, document_id: str
+    ) -> None:
+        """Remember the file stat a document was ingested from."""
+        with self.transaction():
+            self.conn.execute(
+                """
+                INSERT INTO source_files (source_path, mtime_ns, size, document_id)
+                VALUES (?,?,?,?)
+                ON CONFLICT(source_path) DO UPDATE SET
+                    mtime_ns    = excluded.mtime_ns,
+                    size        = excluded.size,
+                    document_id = excluded.document_id
+                """,
+                (source_path, mtime_ns, size, document_id),
+            )
 
     # ------------------------------------------------------------------
     # Entities (property-graph nodes)
@@ -126,7 +217,7 @@ class DocumentStore:
         Validates ``entity.fields`` against the registered type's
         ``fields_schema`` and refreshes the FTS-fed shadow row.
         """
-        type_def = get_entity_type(self.conn, entity.type_slug)
+        type_def = self._type_def("entity", entity.type_slug)
         if type_def is None:
             raise ValueError(
                 f"unknown entity type_slug: {entity.type_slug!r}. "
@@ -135,7 +226,7 @@ class DocumentStore:
         validated_fields = validate_fields(type_def.fields, dict(entity.fields or {}))
 
         now = now_iso()
-        with self.conn:
+        with self.transaction():
             self.conn.execute(
                 """
                 INSERT INTO entities (id, type_slug, canonical_name, aliases, description,
@@ -193,7 +284,7 @@ class DocumentStore:
                 continue
             seen.add(key)
             existing.append(alias)
-        with self.conn:
+        with self.transaction():
             self.conn.execute(
                 "UPDATE entities SET aliases = ?, updated_ts = ? WHERE id = ?",
                 (json.dumps(existing, ensure_ascii=False), now_iso(), entity_id),
@@ -207,7 +298,7 @@ class DocumentStore:
             )
 
     def delete_entity(self, entity_id: str) -> bool:
-        with self.conn:
+        with self.transaction():
             cur = self.conn.execute("DELETE FROM entities WHERE id = ?", (entity_id,))
             self.conn.execute(
                 "DELETE FROM entities_vec WHERE entity_id = ?", (entity_id,)
@@ -218,7 +309,7 @@ class DocumentStore:
     # Relations (property-graph edges)
     # ------------------------------------------------------------------
     def upsert_relation(self, relation: Relation) -> None:
-        type_def = get_relation_type(self.conn, relation.type_slug)
+        type_def = self._type_def("relation", relation.type_slug)
         if type_def is None:
             raise ValueError(
                 f"unknown relation type_slug: {relation.type_slug!r}. "
@@ -226,7 +317,7 @@ class DocumentStore:
             )
         validated_fields = validate_fields(type_def.fields, dict(relation.fields or {}))
         now = now_iso()
-        with self.conn:
+        with self.transaction():
             self.conn.execute(
                 """
                 INSERT INTO relations (id, type_slug, source_entity_id, target_entity_id,
@@ -248,7 +339,7 @@ class DocumentStore:
             )
 
     def delete_relation(self, relation_id: str) -> bool:
-        with self.conn:
+        with self.transaction():
             cur = self.conn.execute("DELETE FROM relations WHERE id = ?", (relation_id,))
         return cur.rowcount > 0
 
@@ -259,22 +350,32 @@ class DocumentStore:
         *,
         contexts: list[str] | None = None,
     ) -> None:
-        with self.conn:
+        with self.transaction():
             self.conn.execute(
-                """
-                INSERT INTO document_relation_mentions (document_id, relation_id, contexts)
-                VALUES (?,?,?)
-                ON CONFLICT(document_id, relation_id) DO UPDATE SET
-                    contexts = excluded.contexts
-                """,
+                _LINK_DOCUMENT_RELATION_SQL,
                 (document_id, relation_id, json.dumps(contexts or [], ensure_ascii=False)),
             )
 
+    def link_document_relations(self, links: Iterable[DocumentRelationLink]) -> None:
+        """Batch ``link_document_relation``: one ``executemany`` for all rows."""
+        with self.transaction():
+            self.conn.executemany(
+                _LINK_DOCUMENT_RELATION_SQL,
+                [
+                    (
+                        link.document_id,
+                        link.relation_id,
+                        json.dumps(link.contexts or [], ensure_ascii=False),
+                    )
+                    for link in links
+                ],
+            )
+
     # ------------------------------------------------------------------
     # Tags
     # ------------------------------------------------------------------
     def upsert_tag(self, tag: Tag, *, embedding: list[float] | None = None) -> None:
-        with self.conn:
+        with self.transaction():
             self.conn.execute(
                 """
                 INSERT INTO tags (id, canonical_name, aliases, category)
@@ -301,15 +402,9 @@ class DocumentStore:
         mention_count: int = 1,
         contexts: list[str] | None = None,
     ) -> None:
-        with self.conn:
+        with self.transaction():
             self.conn.execute(
-                """
-                INSERT INTO document_entities (document_id, entity_id, mention_count, contexts)
-                VALUES (?,?,?,?)
-                ON CONFLICT(document_id, entity_id) DO UPDATE SET
-                    mention_count = excluded.mention_count,
-                    contexts      = excluded.contexts
-                """,
+                _LINK_DOCUMENT_ENTITY_SQL,
                 (
                     document_id,
                     entity_id,
@@ -318,6 +413,22 @@ class DocumentStore:
                 ),
             )
 
+    def link_document_entities(self, links: Iterable[DocumentEntityLink]) -> None:
+        """Batch ``link_document_entity``: one ``executemany`` for all rows."""
+        with self.transaction():
+            self.conn.executemany(
+                _LINK_DOCUMENT_ENTITY_SQL,
+                [
+                    (
+                        link.document_id,
+                        link.entity_id,
+                        link.mention_count,
+                        json.dumps(link.contexts or [], ensure_ascii=False),
+                    )
+                    for link in links
+                ],
+            )
+
     def link_document_tag(
         self,
         document_id: str,
@@ -326,18 +437,42 @@ class DocumentStore:
         confidence: float = 1.0,
         source: str = "llm",
     ) -> None:
-        with self.conn:
+        with self.transaction():
             self.conn.execute(
-                """
-                INSERT INTO document_tags (document_id, tag_id, confidence, source)
-                VALUES (?,?,?,?)
-                ON CONFLICT(document_id, tag_id) DO UPDATE SET
-                    confidence = excluded.confidence,
-                    source     = excluded.source
-                """,
-                (document_id, tag_id, confidence, source),
+                _LINK_DOCUMENT_TAG_SQL, (document_id, tag_id, confidence, source)
+            )
+
+    def link_document_tags(self, links: Iterable[DocumentTagLink]) -> None:
+        """Batch ``link_document_tag``: one ``executemany`` for all rows."""
+        with self.transaction():
+            self.conn.executemany(
+                _LINK_DOCUMENT_TAG_SQL,
+                [
+                    (link.document_id, link.tag_id, link.confidence, link.source)
+                    for link in links
+                ],
             )
 
+    # ------------------------------------------------------------------
+    # Internal: registry lookups
+    # ------------------------------------------------------------------
+    def _type_def(self, kind: str, slug: str) -> Any:
+        """Entity/relation type definition for ``slug`` (None if unknown).
+
+        A document's batch upserts many entities of a handful of types, and
+        each upsert used to re-query and re-parse the type's fields_schema.
+        Inside a transaction the answer is memoised; the memo is dropped
+        when the outermost transaction ends, so registry edits made between
+        batches are always seen.
+        """
+        lookup = get_entity_type if kind == "entity" else get_relation_type
+        if not self._tx_depth:
+            return lookup(self.conn, slug)
+        key = (kind, slug)
+        if key not in self._type_defs:
+            self._type_defs[key] = lookup(self.conn, slug)
+        return self._type_defs[key]
+
     # ------------------------------------------------------------------
     # Internal: searchable_text shadow + vector upsert
     # ------------------------------------------------------------------
@@ -1,5 +1,13 @@
 from docdb.llm.base import LLMProtocol
+from docdb.llm.cache import CachedEmbedder, EmbeddingCache, SQLiteEmbeddingCache
 from docdb.llm.client import LLM
 from docdb.llm.fake import FakeLLM
 
-__all__ = ["LLM", "LLMProtocol", "FakeLLM"]
+__all__ = [
+    "LLM",
+    "LLMProtocol",
+    "CachedEmbedder",
+    "EmbeddingCache",
+    "SQLiteEmbeddingCache",
+    "FakeLLM",
+]
@@ -0,0 +1,219 @@
+"""Query-embedding memoisation.
+
+Every hybrid search embeds the query text before it can touch
+``documents_vec``: the agent's ``search_documents`` tool does it on each
+call, and so does ``POST /api/search`` with ``hybrid=true``. Agents
+re-issue the same query across loop iterations far more often than one
+would expect, and users re-run the same search from the UI, so the
+round-trip to Ollama (tens of ms on GPU, hundreds on CPU) is frequently
+paid twice for an identical vector.
+
+``EmbeddingCache`` is the storage: a bounded, thread-safe LRU keyed by
+``(namespace, sha256(text))``. The namespace is
+``Settings.embed_cache_namespace`` (embed model and server) so vectors
+from different models never mix; hashing the text keeps each key
+at 32 bytes however long the embedded text is. ``CachedEmbedder`` is the
+``LLMProtocol`` adapter that consults it; ``extract`` and
+``chat_with_tools`` pass straight through, so it can be handed to any
+caller that expects an LLM.
+
+``SQLiteEmbeddingCache`` is the persistent variant used by directory
+ingests: the same keys in the ``embedding_cache`` table, so vectors
+survive across runs. Re-ingesting an edited note then only embeds the
+texts that actually changed, and an entity that the dedup pass folds
+into an existing row (and so never gets an ``entities_vec`` row of its
+own) is not re-embedded for every later document that mentions it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Any, Iterable
+
+from docdb.llm.base import LLMProtocol, SchemaT
+from docdb.schema.connection import IN_CHUNK
+
+
+def _text_key(text: str) -> bytes:
+    return hashlib.sha256(text.encode("utf-8")).digest()
+
+
+class EmbeddingCache:
+    """Bounded LRU of ``(namespace, sha256(text)) → vector``.
+
+    ``maxsize=0`` disables caching entirely (every lookup misses and
+    nothing is stored), which keeps the call sites branch-free.
+    """
+
+    def __init__(self, maxsize: int = 512) -> None:
+        self.maxsize = max(0, int(maxsize))
+        self._data: OrderedDict[tuple[str, bytes], list[float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, namespace: str, text: str) -> list[float] | None:
+        key = (namespace, _text_key(text))
+        with self._lock:
+            vec = self._data.get(key)
+            if vec is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return vec
+
+    def put(self, namespace: str, text: str, vector: list[float]) -> None:
+        if self.maxsize == 0:
+            return
+        key = (namespace, _text_key(text))
+        with self._lock:
+            self._data[key] = vector
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_many(self, namespace: str, texts: list[str]) -> list[list[float] | None]:
+        return [self.get(namespace, t) for t in texts]
+
+    def put_many(
+        self, namespace: str, items: Iterable[tuple[str, list[float]]]
+    ) -> None:
+        for text, vector in items:
+            self.put(namespace, text, vector)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+class SQLiteEmbeddingCache:
+    """``EmbeddingCache``-compatible store over the ``embedding_cache`` table.
+
+    One float32 BLOB per distinct text (~4KB for bge-m3). Lookups never
+    write; after each ingest ``finish_bulk_write`` keeps only the newest
+    ``ingest_embed_cache_rows`` rows, so texts that have been edited away
+    (and vectors of a previous model or server) age out. ``clear``
+    (``docdb clear-embed-cache``) empties the table. Uses the caller's
+    connection, so it must stay on that connection's thread. Writes join
+    a transaction the caller already has open, and otherwise commit once
+    per ``put_many``, i.e. only when something new was embedded.
+    """
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM embedding_cache").fetchone()[0]
+
+    def clear(self) -> int:
+        """Delete every cached vector; returns how many rows went."""
+        owns_transaction = not self.conn.in_transaction
+        removed = self.conn.execute("DELETE FROM embedding_cache").rowcount
+        if owns_transaction:
+            self.conn.commit()
+        self.hits = 0
+        self.misses = 0
+        return removed
+
+    def get(self, namespace: str, text: str) -> list[float] | None:
+        return self.get_many(namespace, [text])[0]
+
+    def put(self, namespace: str, text: str, vector: list[float]) -> None:
+        self.put_many(namespace, [(text, vector)])
+
+    def get_many(self, namespace: str, texts: list[str]) -> list[list[float] | None]:
+        keys = [_text_key(t) for t in texts]
+        found: dict[bytes, list[float]] = {}
+        unique = list(dict.fromkeys(keys))
+        for start in range(0, len(unique), IN_CHUNK):
+            chunk = unique[start:start + IN_CHUNK]
+            rows = self.conn.execute(
+                "SELECT text_hash, embedding FROM embedding_cache"
+                f" WHERE namespace = ? AND text_hash IN ({','.join('?' * len(chunk))})",
+                (namespace, *chunk),
+            )
+            for text_hash, blob in rows:
+                vec = array("f")
+                vec.frombytes(blob)
+                found[text_hash] = vec.tolist()
+        out = [found.get(k) for k in keys]
+        hits = sum(v is not None for v in out)
+        self.hits += hits
+        self.misses += len(out) - hits
+        return out
+
+    def put_many(
+        self, namespace: str, items: Iterable[tuple[str, list[float]]]
+    ) -> None:
+        rows = [
+            (namespace, _text_key(text), array("f", vector).tobytes())
+            for text, vector in items
+        ]
+        if not rows:
+            return
+        owns_transaction = not self.conn.in_transaction
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO embedding_cache (namespace, text_hash, embedding)"
+            " VALUES (?,?,?)",
+            rows,
+        )
+        if owns_transaction:
+            self.conn.commit()
+
+
+class CachedEmbedder:
+    """``LLMProtocol`` wrapper that serves ``embed`` from an ``EmbeddingCache``.
+
+    Only the cache misses of a call are forwarded to the wrapped LLM, in
+    one batched ``embed`` request, so a partially-cached batch still
+    costs a single round-trip. Returned vectors are shared with the
+    cache; callers must treat them as read-only (every current caller
+    only packs them into a BLOB).
+    """
+
+    def __init__(
+        self,
+        llm: LLMProtocol,
+        cache: EmbeddingCache | SQLiteEmbeddingCache,
+        *,
+        namespace: str = "",
+    ) -> None:
+        self.llm = llm
+        self.cache = cache
+        self.namespace = namespace
+
+    def extract(self, text: str, schema: type[SchemaT]) -> SchemaT:
+        return self.llm.extract(text, schema)
+
+    def chat_with_tools(
+        self,
+        messages: list[dict],
+        tools: list[dict] | None = None,
+        *,
+        model: str | None = None,
+    ) -> Any:
+        return self.llm.chat_with_tools(messages, tools, model=model)
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        vectors = self.cache.get_many(self.namespace, texts)
+        # dict.fromkeys de-duplicates while keeping order, so a batch that
+        # repeats a text only embeds it once.
+        missing = list(dict.fromkeys(t for t, v in zip(texts, vectors) if v is None))
+        if not missing:
+            return vectors  # type: ignore[return-value]
+
+        fresh = dict(zip(missing, self.llm.embed(missing)))
+        self.cache.put_many(self.namespace, fresh.items())
+        return [v if v is not None else fresh[t] for t, v in zip(texts, vectors)]
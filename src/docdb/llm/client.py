@@ -13,15 +13,18 @@ around it.
 * ``chat_with_tools``: tool-calling against ``agent_model`` (Ollama
   native path). Wrapped to walk like an OpenAI ``ChatCompletion`` so
   ``loop.py`` stays unaware of the transport.
-* ``embed``: vector embeddings via ``embed_model`` (OpenAI-compat path).
+* ``embed``: vector embeddings via ``embed_model`` (OpenAI-compat path),
+  optionally against a dedicated ``embed_base_url`` server so query
+  embedding does not queue behind generation in the same Ollama process.
 """
 
 from __future__ import annotations
 
 import json
+import threading
 import uuid
 from dataclasses import dataclass
-from typing import Any, TypeVar
+from typing import Any, Callable, TypeVar
 
 import instructor
 import ollama
@@ -32,6 +35,7 @@ from docdb.config import Settings, get_settings
 
 
 SchemaT = TypeVar("SchemaT", bound=BaseModel)
+ClientT = TypeVar("ClientT")
 
 
 # ---------------------------------------------------------------------------
@@ -69,16 +73,50 @@ class _ShimCompletion:
 
 
 class LLM:
+    """Ollama-backed ``LLMProtocol``.
+
+    The transport clients are built on first use rather than in
+    ``__init__``: ingestion never calls ``chat_with_tools`` and the
+    search API never calls ``extract``, so each path only pays for the
+    clients it actually touches (``instructor`` patching in particular
+    is not free). One instance is shared across server request threads
+    and ingest worker threads, so first use is guarded by a lock: two
+    threads racing to build a client must not end up with separate
+    connection pools.
+    """
+
     def __init__(self, settings: Settings | None = None) -> None:
         self.settings = settings or get_settings()
-        self._openai = OpenAI(
-            base_url=self.settings.ollama_base_url,
-            api_key="ollama",
+        self._clients: dict[str, Any] = {}
+        # Re-entrant: building ``_instructor`` / ``_embed_openai`` first
+        # builds ``_openai`` under the same lock.
+        self._clients_lock = threading.RLock()
+
+    def _client(self, name: str, build: Callable[[], ClientT]) -> ClientT:
+        client = self._clients.get(name)
+        if client is None:
+            with self._clients_lock:
+                client = self._clients.get(name)
+                if client is None:
+                    client = self._clients[name] = build()
+        return client
+
+    @property
+    def _openai(self) -> OpenAI:
+        return self._client(
+            "openai",
+            lambda: OpenAI(base_url=self.settings.ollama_base_url, api_key="ollama"),
         )
-        self._instructor = instructor.from_openai(
-            self._openai,
-            mode=instructor.Mode.JSON,
+
+    @property
+    def _instructor(self) -> Any:
+        return self._client(
+            "instructor",
+            lambda: instructor.from_openai(self._openai, mode=instructor.Mode.JSON),
         )
+
+    @property
+    def _ollama(self) -> ollama.Client:
         # Native client for tool-calling. Strip the OpenAI-compat ``/v1``
         # suffix so the same ``DOCDB_OLLAMA_BASE_URL`` env var configures
         # both transports.
@@ -86,7 +124,18 @@ class LLM:
             self.settings.ollama_base_url.rstrip("/").removesuffix("/v1")
             or "http://localhost:11434"
         )
-        self._ollama = ollama.Client(host=native_host)
+        return self._client("ollama", lambda: ollama.Client(host=native_host))
+
+    @property
+    def _embed_openai(self) -> OpenAI:
+        # Embeddings reuse the Ollama OpenAI-compat client unless a
+        # dedicated embedding server is configured.
+        if self.settings.embed_base_url:
+            return self._client(
+                "embed_openai",
+                lambda: OpenAI(base_url=self.settings.embed_base_url, api_key="none"),
+            )
+        return self._openai
 
     # ------------------------------------------------------------------
     # Structured extraction (ingestion pipeline)
@@ -126,12 +175,24 @@ class LLM:
     # Embeddings
     # ------------------------------------------------------------------
     def embed(self, texts: list[str]) -> list[list[float]]:
-        resp = self._openai.embeddings.create(
-            model=self.settings.embed_model,
-            input=texts,
-            extra_body={"keep_alive": self.settings.keep_alive},
+        # One request per ``embed_batch_size`` inputs: callers hand over
+        # whole batches (every entity of a document at once) and get one
+        # round-trip per slice instead of one per text.
+        size = self.settings.embed_batch_size
+        # ``keep_alive`` is an Ollama extension; other servers may reject it.
+        extra_body = (
+            None if self.settings.embed_base_url
+            else {"keep_alive": self.settings.keep_alive}
         )
-        return [item.embedding for item in resp.data]
+        vectors: list[list[float]] = []
+        for start in range(0, len(texts), size):
+            resp = self._embed_openai.embeddings.create(
+                model=self.settings.embed_model,
+                input=texts[start:start + size],
+                extra_body=extra_body,
+            )
+            vectors.extend(item.embedding for item in resp.data)
+        return vectors
 
 
 # ---------------------------------------------------------------------------
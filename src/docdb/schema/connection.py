@@ -3,7 +3,7 @@ from __future__ import annotations
 import sqlite3
 from importlib import resources
 from pathlib import Path
-from typing import Iterator
+from typing import Iterator, Literal
 from contextlib import contextmanager
 
 import sqlite_vec
@@ -12,6 +12,18 @@ import sqlite_vec
 _SCHEMA_RESOURCE = ("docdb.schema", "schema.sql")
 _SEED_RESOURCE = ("docdb.schema", "seed.sql")
 
+# Map up to this many bytes of the database file instead of copying pages
+# through SQLite's own cache. Reads of documents_vec / documents_fts then
+# come straight from the OS page cache, which is shared by every
+# connection (the server opens one per request) and survives process
+# restarts. SQLite clamps the value to the file size, so small corpora
+# cost nothing extra.
+_MMAP_SIZE = 256 * 1024 * 1024
+
+# Batch lookups bind at most this many ids per ``IN (...)`` query, well
+# under SQLITE_MAX_VARIABLE_NUMBER on older builds (999 before 3.32).
+IN_CHUNK = 500
+
 
 def _load_extensions(conn: sqlite3.Connection) -> None:
     conn.enable_load_extension(True)
@@ -23,6 +35,7 @@ def _load_extensions(conn: sqlite3.Connection) -> None:
 
 def _apply_pragmas(conn: sqlite3.Connection, *, readonly: bool) -> None:
     conn.execute("PRAGMA foreign_keys = ON")
+    conn.execute(f"PRAGMA mmap_size = {_MMAP_SIZE}")
     if not readonly:
         conn.execute("PRAGMA journal_mode = WAL")
         conn.execute("PRAGMA synchronous = NORMAL")
@@ -47,6 +60,45 @@ def get_connection(db_path: Path | str, *, readonly: bool = False) -> sqlite3.Co
     return conn
 
 
+def finish_bulk_write(
+    conn: sqlite3.Connection,
+    *,
+    embed_cache_rows: int | None = None,
+    checkpoint: Literal["PASSIVE", "TRUNCATE"] = "TRUNCATE",
+) -> None:
+    """Housekeeping to run once after a batch of ingests, not per document.
+
+    ``embed_cache_rows`` caps the ingest embedding cache to its newest
+    rows. That is its only eviction: vectors of a previous embed model
+    or server are never hit again and age out like any other row.
+    ``PRAGMA optimize`` refreshes planner statistics for the indexes the
+    batch just grew. The TRUNCATE checkpoint folds the accumulated WAL
+    back into the main file and resets it to zero bytes, so later readers
+    don't scan a long WAL on every page lookup; it waits (up to the busy
+    timeout) for active readers to finish, so it belongs in the CLI.
+    Request handlers pass ``checkpoint="PASSIVE"``, which copies back
+    whatever readers don't pin and returns at once.
+    Like ``SQLiteEmbeddingCache``, this joins a transaction the caller
+    already has open rather than committing it (and then skips the
+    checkpoint).
+    """
+    owns_transaction = not conn.in_transaction
+    if embed_cache_rows is not None:
+        conn.execute(
+            "DELETE FROM embedding_cache WHERE rowid <= ("
+            " SELECT rowid FROM embedding_cache ORDER BY rowid DESC LIMIT 1 OFFSET ?)",
+            (embed_cache_rows,),
+        )
+    conn.execute("PRAGMA optimize")
+    if not owns_transaction:
+        # A checkpoint can't run under the caller's open write
+        # transaction ("database table is locked"); the next batch's
+        # checkpoint folds this WAL back instead.
+        return
+    conn.commit()
+    conn.execute(f"PRAGMA wal_checkpoint({checkpoint})")
+
+
 def _read_resource(resource: tuple[str, str]) -> str:
     package, name = resource
     return resources.files(package).joinpath(name).read_text(encoding="utf-8")
@@ -256,6 +256,38 @@ CREATE TABLE IF NOT EXISTS extraction_runs (
     FOREIGN KEY(document_id) REFERENCES documents(id) ON DELETE CASCADE
 );
 
+-- ============================================================
+-- Source file stat cache
+-- ============================================================
+-- (mtime_ns, size) of each file as of its last successful ingest.
+-- IngestionPipeline.ingest_file skips files whose stat still matches
+-- without reading or hashing them. Rows cascade away with the document,
+-- so a deleted or replaced document always forces a re-read.
+CREATE TABLE IF NOT EXISTS source_files (
+    source_path  TEXT PRIMARY KEY,
+    mtime_ns     INTEGER NOT NULL,
+    size         INTEGER NOT NULL,
+    document_id  TEXT NOT NULL,
+    FOREIGN KEY(document_id) REFERENCES documents(id) ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS idx_source_files_document ON source_files(document_id);
+
+-- ============================================================
+-- Embedding cache
+-- ============================================================
+-- float32 vectors keyed by (embed model, sha256(input text)); see
+-- docdb.llm.cache.SQLiteEmbeddingCache. Ingest consults it before calling
+-- the embedder, so a re-ingest only pays for texts it has never seen.
+-- The rowid follows insertion order (INSERT OR REPLACE gives a re-stored
+-- text a new one), and finish_bulk_write keeps only the newest rows.
+-- Safe to empty at any time.
+CREATE TABLE IF NOT EXISTS embedding_cache (
+    namespace  TEXT NOT NULL,
+    text_hash  BLOB NOT NULL,
+    embedding  BLOB NOT NULL,
+    PRIMARY KEY (namespace, text_hash)
+);
+
 -- ============================================================
 -- FTS5 (trigram tokenizer for Japanese-friendly substring match)
 -- ============================================================
@@ -8,22 +8,26 @@ read-only.
 
 from __future__ import annotations
 
+import json
 import sqlite3
 from typing import Iterable
 
 from docdb.ingestion.store import pack_embedding
 from docdb.models import Citation, Document, Entity, Relation
+from docdb.schema.connection import IN_CHUNK
 
 
-def _row_to_document(row: sqlite3.Row) -> Document:
-    import json as _json
+def _parse_metadata(raw: str | None) -> dict:
+    if not raw:
+        return {}
+    try:
+        return json.loads(raw)
+    except (ValueError, TypeError):
+        return {}
 
-    metadata = {}
-    if row["metadata"]:
-        try:
-            metadata = _json.loads(row["metadata"])
-        except (ValueError, TypeError):
-            metadata = {}
+
+def _row_to_document(row: sqlite3.Row) -> Document:
+    metadata = _parse_metadata(row["metadata"])
     return Document(
         id=row["id"],
         source_path=row["source_path"],
@@ -42,18 +46,16 @@ def _row_to_document(row: sqlite3.Row) -> Document:
 
 
 def _row_to_entity(row: sqlite3.Row) -> Entity:
-    import json as _json
-
     aliases: list[str] = []
     fields: dict = {}
     if row["aliases"]:
         try:
-            aliases = _json.loads(row["aliases"])
+            aliases = json.loads(row["aliases"])
         except (ValueError, TypeError):
             aliases = []
     if row["fields"]:
         try:
-            fields = _json.loads(row["fields"])
+            fields = json.loads(row["fields"])
         except (ValueError, TypeError):
             fields = {}
     return Entity(
@@ -67,12 +69,10 @@ def _row_to_entity(row: sqlite3.Row) -> Entity:
 
 
 def _row_to_relation(row: sqlite3.Row) -> Relation:
-    import json as _json
-
     fields: dict = {}
     if row["fields"]:
         try:
-            fields = _json.loads(row["fields"])
+            fields = json.loads(row["fields"])
         except (ValueError, TypeError):
             fields = {}
     return Relation(
@@ -94,6 +94,67 @@ def get_document(conn: sqlite3.Connection, document_id: str) -> Document | None:
     return _row_to_document(row) if row else None
 
 
+def get_document_preview(
+    conn: sqlite3.Connection, document_id: str, *, max_chars: int
+) -> dict | None:
+    """``get_document(...).model_dump()`` with raw_text cut to ``max_chars``.
+
+    SQLite does the cut, so a long note's full body never leaves the
+    database; the head still goes through ``Document`` like any other
+    row. A cut body ends with a ``[... truncated ...]`` marker.
+    """
+    row = conn.execute(
+        """
+        SELECT id, source_path, source_uri, source_type, title, doc_type,
+               author, created_at, summary, substr(raw_text, 1, ?) AS raw_text,
+               length(raw_text) AS raw_len, content_hash, language, metadata
+        FROM documents WHERE id = ?
+        """,
+        (max_chars, document_id),
+    ).fetchone()
+    if row is None:
+        return None
+    doc = _row_to_document(row)
+    if doc.raw_text and row["raw_len"] > max_chars:
+        doc.raw_text += "\n[... truncated ...]"
+    return doc.model_dump()
+
+
+def get_citations(
+    conn: sqlite3.Connection, document_ids: list[str], *, snippet_chars: int = 160
+) -> list[Citation]:
+    """Batch citation lookup: ``IN`` queries of up to ``IN_CHUNK`` ids, in
+    ``document_ids`` order.
+
+    Unknown ids are dropped. The snippet is the summary, else the head of
+    raw_text, cut in SQL so full bodies never leave the database.
+    """
+    ids = list(dict.fromkeys(document_ids))
+    by_id: dict[str, sqlite3.Row] = {}
+    for start in range(0, len(ids), IN_CHUNK):
+        chunk = ids[start:start + IN_CHUNK]
+        rows = conn.execute(
+            f"""
+            SELECT id, title, source_path, doc_type,
+                   substr(COALESCE(NULLIF(summary, ''), raw_text, ''), 1, ?) AS snippet
+            FROM documents WHERE id IN ({",".join("?" * len(chunk))})
+            """,
+            (snippet_chars, *chunk),
+        )
+        by_id.update((r["id"], r) for r in rows)
+    return [
+        Citation(
+            document_id=r["id"],
+            title=r["title"],
+            snippet=r["snippet"] or None,
+            source_path=r["source_path"],
+            doc_type=r["doc_type"],
+        )
+        for doc_id in ids
+        if (r := by_id.get(doc_id)) is not None
+    ]
+
+
 def count_documents(
     conn: sqlite3.Connection, *, doc_type: str | None = None
 ) -> int:
@@ -283,6 +344,20 @@ def get_entity(conn: sqlite3.Connection, entity_id: str) -> Entity | None:
     return _row_to_entity(row) if row else None
 
 
+def get_entities(conn: sqlite3.Connection, entity_ids: list[str]) -> dict[str, Entity]:
+    """Batch ``get_entity``: ``IN`` queries of up to ``IN_CHUNK`` ids, keyed
+    by id. Missing ids are simply absent from the result."""
+    ids = list(dict.fromkeys(entity_ids))
+    found: dict[str, Entity] = {}
+    for start in range(0, len(ids), IN_CHUNK):
+        chunk = ids[start:start + IN_CHUNK]
+        rows = conn.execute(
+            f"SELECT * FROM entities WHERE id IN ({','.join('?' * len(chunk))})", chunk
+        )
+        found.update((r["id"], _row_to_entity(r)) for r in rows)
+    return found
+
+
 def get_entity_documents(
     conn: sqlite3.Connection, entity_id: str, *, top_k: int = 20
 ) -> list[Document]:
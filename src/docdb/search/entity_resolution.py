@@ -31,7 +31,7 @@ import sqlite3
 from dataclasses import dataclass
 
 from docdb.llm.base import LLMProtocol
-from docdb.search.direct import get_entity, search_entities_by_embedding
+from docdb.search.direct import get_entities, search_entities_by_embedding
 
 
 @dataclass(frozen=True)
@@ -67,11 +67,12 @@ def resolve_mentions(
         return []
 
     hits = search_entities_by_embedding(conn, vec, type_slug=None, top_k=top_k)
+    hits = [(eid, d) for eid, d in hits if d <= distance_threshold]
+    # One round-trip for every surviving hit instead of one per hit.
+    entities = get_entities(conn, [eid for eid, _ in hits])
     out: list[ResolvedCandidate] = []
     for entity_id, distance in hits:
-        if distance > distance_threshold:
-            continue
-        ent = get_entity(conn, entity_id)
+        ent = entities.get(entity_id)
         if ent is None:
             continue
         out.append(
@@ -15,10 +15,16 @@ Why we use it here:
   semantically about contract termination".
 * The fallback paths (FTS-only or vec-only) keep the same call signature,
   so callers don't branch.
+
+Each arm's contribution can be scaled (``fts_weight`` / ``vec_weight``,
+weighted RRF). bge-m3 maps rare proper nouns and product names poorly,
+so leaning on the FTS arm recovers exact-term hits without giving up
+the semantic arm; both default to 1.0, which is plain RRF.
 """
 
 from __future__ import annotations
 
+import heapq
 import sqlite3
 from collections import defaultdict
 from typing import Iterable
@@ -38,6 +44,8 @@ def hybrid_search(
     date_to: str | None = None,
     rrf_k: int = 60,
     fetch_multiplier: int = 3,
+    fts_weight: float = 1.0,
+    vec_weight: float = 1.0,
 ) -> list[Citation]:
     """Fused FTS + vec ranking.
 
@@ -80,7 +88,14 @@ def hybrid_search(
     if vec_results and not fts_results:
         return vec_results[:top_k]
 
-    return _rrf_fuse(fts_results, vec_results, top_k=top_k, rrf_k=rrf_k)
+    return _rrf_fuse(
+        fts_results,
+        vec_results,
+        top_k=top_k,
+        rrf_k=rrf_k,
+        fts_weight=fts_weight,
+        vec_weight=vec_weight,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -92,22 +107,27 @@ def _rrf_fuse(
     *,
     top_k: int,
     rrf_k: int,
+    fts_weight: float = 1.0,
+    vec_weight: float = 1.0,
 ) -> list[Citation]:
     rrf_scores: dict[str, float] = defaultdict(float)
     snippet_pool: dict[str, Citation] = {}
 
     # FTS arm — take the bm25-ordered list as-is and trust its snippets.
     for rank, c in enumerate(fts_results, start=1):
-        rrf_scores[c.document_id] += 1.0 / (rrf_k + rank)
+        rrf_scores[c.document_id] += fts_weight / (rrf_k + rank)
         snippet_pool[c.document_id] = c
 
     # Vec arm — only fill metadata for documents the FTS arm missed.
     for rank, c in enumerate(vec_results, start=1):
-        rrf_scores[c.document_id] += 1.0 / (rrf_k + rank)
+        rrf_scores[c.document_id] += vec_weight / (rrf_k + rank)
         snippet_pool.setdefault(c.document_id, c)
 
-    ranked_ids = sorted(rrf_scores, key=rrf_scores.get, reverse=True)
+    # Partial top-k selection instead of a full sort: only ``top_k`` of the
+    # ~2×over-fetch candidates are kept. nlargest is stable on ties, so
+    # the FTS-first order among equal scores is unchanged.
+    ranked_ids = heapq.nlargest(top_k, rrf_scores, key=rrf_scores.__getitem__)
     return [
         snippet_pool[doc_id].model_copy(update={"score": rrf_scores[doc_id]})
-        for doc_id in ranked_ids[:top_k]
+        for doc_id in ranked_ids
     ]
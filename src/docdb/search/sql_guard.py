@@ -69,19 +69,21 @@ def validate_readonly_sql(
     if not sql or not sql.strip():
         raise UnsafeQueryError("empty SQL")
 
-    # Reject multi-statement strings outright. parse_one tolerates them
-    # by returning only the first statement, so we look at parse() too.
-    statements = [s for s in sqlglot.parse(sql, dialect="sqlite") if s is not None]
-    if len(statements) > 1:
-        raise UnsafeQueryError("multiple statements are not allowed")
-
+    # One parse serves both checks: parse() yields every statement, so
+    # multi-statement strings are rejected from the same result the
+    # single tree is taken from (parse_one would silently keep only the
+    # first statement, and tokenising twice doubled the cost).
     try:
-        tree = sqlglot.parse_one(sql, dialect="sqlite")
+        parsed = sqlglot.parse(sql, dialect="sqlite")
     except Exception as exc:  # pragma: no cover - sqlglot raises a few types
         raise UnsafeQueryError(f"could not parse SQL: {exc}") from exc
 
-    if tree is None:
+    statements = [s for s in parsed if s is not None]
+    if len(statements) > 1:
+        raise UnsafeQueryError("multiple statements are not allowed")
+    if not statements:
         raise UnsafeQueryError("empty parse tree")
+    tree = statements[0]
 
     # The outermost node must be a SELECT-shaped expression.
     if not isinstance(tree, (exp.Select, exp.Union, exp.With, exp.Subquery)):
@@ -89,13 +91,16 @@ def validate_readonly_sql(
             f"only SELECT/WITH/UNION is allowed; got {type(tree).__name__}"
         )
 
-    # Forbidden node check.
-    for node_type in _FORBIDDEN_NODES:
-        bad = next(tree.find_all(node_type), None)
-        if bad is not None:
-            raise UnsafeQueryError(
-                f"forbidden statement type: {node_type.__name__}"
-            )
+    # Forbidden node check — one tree walk for all node types rather than
+    # one walk per type. The error names the type listed first in
+    # _FORBIDDEN_NODES, not whichever node the walk happens to reach first.
+    found = {
+        next(i for i, t in enumerate(_FORBIDDEN_NODES) if isinstance(node, t))
+        for node in tree.find_all(*_FORBIDDEN_NODES)
+    }
+    if found:
+        node_type = _FORBIDDEN_NODES[min(found)]
+        raise UnsafeQueryError(f"forbidden statement type: {node_type.__name__}")
 
     # Table-allowlist check (skip CTE names defined in this same query).
     cte_names = _collect_cte_names(tree)
@@ -118,12 +118,16 @@ def run_text2sql(
     # Default mirrors ``Settings.query_resolution_distance`` so direct
     # callers and the Toolbox path see the same threshold.
     resolution_distance_threshold: float = 0.85,
+    entity_types: list[EntityTypeDef] | None = None,
+    relation_types: list[RelationTypeDef] | None = None,
 ) -> Text2SQLResult:
     """Generate → validate → execute, with KNN-fallback retry.
 
     The current entity/relation type registry is fetched from ``conn``
     and injected into the SQL-generation prompt so the LLM sees each
-    type's ``fields_schema``.
+    type's ``fields_schema``. Callers that already hold the registry
+    (the agent ``Toolbox`` keeps it for a whole run) pass
+    ``entity_types`` / ``relation_types`` to skip the fetch.
 
     Retry: if the primary attempt errors or returns zero rows AND
     ``resolution_enabled`` is true, ``resolve_mentions`` is invoked on
@@ -132,14 +136,8 @@ def run_text2sql(
     second SQL-generation pass runs on the rewritten question. The
     better of the two results is returned.
     """
-    try:
-        entity_types = list_entity_types(conn)
-        relation_types = list_relation_types(conn)
-    except sqlite3.Error:
-        # Registry fetch is a best-effort enrichment; on failure fall back
-        # to an empty catalogue rather than blocking the SQL generation.
-        entity_types = []
-        relation_types = []
+    if entity_types is None or relation_types is None:
+        entity_types, relation_types = fetch_type_registry(conn)
 
     primary = _execute_text2sql(
         conn, question, llm,
@@ -184,6 +182,18 @@ def run_text2sql(
     return retry
 
 
+def fetch_type_registry(
+    conn: sqlite3.Connection,
+) -> tuple[list[EntityTypeDef], list[RelationTypeDef]]:
+    """Entity + relation type definitions for the SQL-generation prompt."""
+    try:
+        return list_entity_types(conn), list_relation_types(conn)
+    except sqlite3.Error:
+        # Registry fetch is a best-effort enrichment; on failure fall back
+        # to an empty catalogue rather than blocking the SQL generation.
+        return [], []
+
+
 def _execute_text2sql(
     conn: sqlite3.Connection,
     question: str,
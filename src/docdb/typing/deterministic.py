@@ -33,6 +33,11 @@ _TODO_PATTERNS: tuple[re.Pattern, ...] = (
     re.compile(r"\b(?:TODO|FIXME|HACK|XXX)\s*[:：]?\s*(.+?)\s*$", re.IGNORECASE),
 )
 _DONE_PATTERN = re.compile(r"^\s*[-*]\s+\[x\]\s+", re.IGNORECASE)
+# Every line either of _TODO_PATTERNS can match contains one of these
+# literals (same IGNORECASE folding). One search over the whole text
+# rejects the common note without a single task; per line it replaces the
+# done-check plus two pattern searches on lines that cannot match.
+_TASK_HINT = re.compile(r"\[ \]|TODO|FIXME|HACK|XXX", re.IGNORECASE)
 
 _HIGH_PRIORITY = ("urgent", "asap", "急", "緊急", "至急")
 _LOW_PRIORITY = ("later", "後で", "将来", "いつか")
@@ -48,9 +53,11 @@ def task_checkbox(text: str) -> list[dict]:
     "priority": <high|medium|low>}}``.
     """
     out: list[dict] = []
+    if not _TASK_HINT.search(text):
+        return out
     seen: set[str] = set()
     for line in text.splitlines():
-        if _DONE_PATTERN.match(line):
+        if not _TASK_HINT.search(line) or _DONE_PATTERN.match(line):
             continue
         for pat in _TODO_PATTERNS:
             match = pat.search(line)
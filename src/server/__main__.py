@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import logging
 import os
 
+from docdb.config import get_settings
 from server.app import create_app
 
 
 def main() -> None:
+    logging.basicConfig(
+        level=get_settings().log_level,
+        format="%(levelname)s %(name)s: %(message)s",
+    )
     app = create_app()
     host = os.environ.get("DOCDB_HOST", "127.0.0.1")
     port = int(os.environ.get("DOCDB_PORT", "5000"))
@@ -11,6 +11,7 @@ from flask_cors import CORS
 
 from docdb.config import Settings, get_settings
 from docdb.llm.base import LLMProtocol
+from docdb.llm.cache import EmbeddingCache
 from docdb.llm.client import LLM
 from docdb.schema.connection import init_db
 
@@ -47,6 +48,8 @@ def create_app(
 
     app.config["DOCDB_SETTINGS"] = settings
     app.config["DOCDB_LLM_FACTORY"] = llm_factory
+    # Process-wide so repeated queries across requests skip the embed call.
+    app.config["DOCDB_EMBED_CACHE"] = EmbeddingCache(settings.embed_cache_size)
 
     init_db(settings.db_path)
 
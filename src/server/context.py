@@ -7,14 +7,19 @@ otherwise arises between the app factory and the route blueprints.
 from __future__ import annotations
 
 import sqlite3
+import threading
 
 from flask import current_app, g
 
 from docdb.config import Settings
 from docdb.llm.base import LLMProtocol
+from docdb.llm.cache import CachedEmbedder
 from docdb.schema.connection import get_connection
 
 
+_llm_lock = threading.Lock()
+
+
 def get_conn() -> sqlite3.Connection:
     if "docdb_conn" not in g:
         settings: Settings = current_app.config["DOCDB_SETTINGS"]
@@ -23,8 +28,30 @@ def get_conn() -> sqlite3.Connection:
 
 
 def get_llm() -> LLMProtocol:
-    if "docdb_llm" not in g:
+    """The app-wide LLM, built on first use.
+
+    Shared across requests (the OpenAI / Ollama clients are thread-safe)
+    so their HTTP connection pools stay warm: a per-request client paid
+    a fresh TCP connect to Ollama or the embedding server on every call.
+    """
+    llm = current_app.config.get("DOCDB_LLM")
+    if llm is None:
+        with _llm_lock:
+            llm = current_app.config.get("DOCDB_LLM")
+            if llm is None:
+                settings: Settings = current_app.config["DOCDB_SETTINGS"]
+                factory = current_app.config["DOCDB_LLM_FACTORY"]
+                llm = current_app.config["DOCDB_LLM"] = factory(settings)
+    return llm
+
+
+def get_embedder() -> LLMProtocol:
+    """The request's LLM, with ``embed`` served through the app-wide cache."""
+    if "docdb_embedder" not in g:
         settings: Settings = current_app.config["DOCDB_SETTINGS"]
-        factory = current_app.config["DOCDB_LLM_FACTORY"]
-        g.docdb_llm = factory(settings)
-    return g.docdb_llm
+        g.docdb_embedder = CachedEmbedder(
+            get_llm(),
+            current_app.config["DOCDB_EMBED_CACHE"],
+            namespace=settings.embed_cache_namespace,
+        )
+    return g.docdb_embedder
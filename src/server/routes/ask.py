@@ -9,7 +9,7 @@ from docdb.agent.toolbox import Toolbox
 from docdb.config import Settings
 from docdb.llm.prompts import AGENT_SYSTEM
 
-from server.context import get_conn, get_llm
+from server.context import get_conn, get_embedder, get_llm
 
 bp = Blueprint("ask", __name__, url_prefix="/api")
 
@@ -32,11 +32,14 @@ def ask():
     toolbox = Toolbox(
         conn,
         llm,
+        embedder=get_embedder(),
         max_sql_limit=settings.sql_max_limit,
         text2sql_prompt_max_bytes=settings.text2sql_prompt_max_bytes,
         query_resolution_enabled=settings.query_resolution_enabled,
         query_resolution_top_k=settings.query_resolution_top_k,
         query_resolution_distance=settings.query_resolution_distance,
+        hybrid_fts_weight=settings.hybrid_fts_weight,
+        hybrid_vec_weight=settings.hybrid_vec_weight,
     )
     agent = SearchAgent(
         toolbox=toolbox,
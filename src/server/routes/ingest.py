@@ -7,6 +7,8 @@ from flask import Blueprint, current_app, jsonify, request
 
 from docdb.config import Settings
 from docdb.ingestion import DocumentStore, IngestionPipeline
+from docdb.llm.cache import CachedEmbedder, SQLiteEmbeddingCache
+from docdb.schema.connection import finish_bulk_write
 
 from server.context import get_conn, get_llm
 
@@ -32,9 +34,17 @@ def ingest_endpoint():
     conn = get_conn()
     pipeline = IngestionPipeline(
         store=DocumentStore(conn),
-        llm=llm,
+        # The persistent ingest cache rather than the app-wide query LRU:
+        # ingest texts would only evict the query vectors it exists for.
+        llm=CachedEmbedder(
+            llm,
+            SQLiteEmbeddingCache(conn),
+            namespace=settings.embed_cache_namespace,
+        ),
         entity_dedup_enabled=settings.entity_dedup_enabled,
         entity_dedup_distance=settings.entity_dedup_distance,
+        read_ahead=settings.ingest_read_ahead,
+        extract_workers=settings.extract_workers,
     )
 
     if path.is_file():
@@ -45,6 +55,13 @@ def ingest_endpoint():
     summary: dict[str, int] = {"created": 0, "updated": 0, "skipped": 0, "error": 0}
     for r in reports:
         summary[r.status] = summary.get(r.status, 0) + 1
+    if summary["created"] or summary["updated"]:
+        # PASSIVE: a TRUNCATE checkpoint would wait on /api/ask readers.
+        finish_bulk_write(
+            conn,
+            embed_cache_rows=settings.ingest_embed_cache_rows,
+            checkpoint="PASSIVE",
+        )
 
     return jsonify(
         {
@@ -101,11 +101,10 @@ def update_relation_route(relation_id: str):
     if "fields" not in payload:
         return _client_error("only `fields` may be patched on a relation")
 
-    import json as _json
     existing_fields: dict = {}
     if row["fields"]:
         try:
-            existing_fields = _json.loads(row["fields"]) or {}
+            existing_fields = json.loads(row["fields"]) or {}
         except (ValueError, TypeError):
             existing_fields = {}
 
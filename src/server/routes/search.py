@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, current_app, jsonify, request
 
+from docdb.config import Settings
 from docdb.search.direct import search as direct_search
 from docdb.search.hybrid import hybrid_search
 
-from server.context import get_conn, get_llm
+from server.context import get_conn, get_embedder
 
 bp = Blueprint("search", __name__, url_prefix="/api")
 
@@ -27,9 +28,9 @@ def search_endpoint():
     conn = get_conn()
 
     if use_hybrid and query:
-        llm = get_llm()
+        settings: Settings = current_app.config["DOCDB_SETTINGS"]
         try:
-            [embedding] = llm.embed([query])
+            [embedding] = get_embedder().embed([query])
         except Exception as exc:  # noqa: BLE001
             return jsonify({"error": f"embedding failed: {exc}"}), 502
         hits = hybrid_search(
@@ -40,6 +41,8 @@ def search_endpoint():
             doc_type=doc_type,
             date_from=date_from,
             date_to=date_to,
+            fts_weight=settings.hybrid_fts_weight,
+            vec_weight=settings.hybrid_vec_weight,
         )
     else:
         hits = direct_search(
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sqlite3
 from pathlib import Path
 
 import pytest
@@ -16,10 +17,32 @@ from tests.docdb.fixtures import (
 )
 
 
+@pytest.fixture(scope="session")
+def _schema_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Schema + seeds applied once per session.
+
+    Every DB-backed test starts from the same freshly-initialised file, so
+    running schema.sql/seed.sql per test is pure repetition. ``db_path``
+    copies this template instead.
+    """
+    path = tmp_path_factory.mktemp("schema") / "template.sqlite"
+    init_db(path)
+    return path
+
+
 @pytest.fixture
-def db_path(tmp_path: Path) -> Path:
+def db_path(tmp_path: Path, _schema_template: Path) -> Path:
     path = tmp_path / "docdb.sqlite"
-    init_db(path)
+    # The online-backup API copies a consistent snapshot even while the
+    # template still has WAL frames, and it is page-level so the vec0
+    # shadow tables come across without loading sqlite-vec here.
+    src = sqlite3.connect(_schema_template)
+    dst = sqlite3.connect(path)
+    try:
+        src.backup(dst)
+    finally:
+        dst.close()
+        src.close()
     return path
 
 
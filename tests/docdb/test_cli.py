@@ -16,6 +16,7 @@ the property-graph redesign along with the dedicated ``todos`` table.
 from __future__ import annotations
 
 import json
+import sqlite3
 from pathlib import Path
 
 import pytest
@@ -120,6 +121,8 @@ def test_ingest_dir_summarises_results(runner: CliRunner, tmp_path: Path) -> Non
         },
     )
     assert result.exit_code == 0, result.output
+    assert f"[1/2] processing {notes / 'a.md'} ..." in result.output
+    assert f"[2/2] processing {notes / 'b.md'} ..." in result.output
     assert "created=2" in result.output
 
 
@@ -142,6 +145,58 @@ def test_ingest_skips_unchanged_file_on_second_run(
     assert "= skipped" in second.output
 
 
+def test_clear_embed_cache_empties_the_ingest_cache(
+    runner: CliRunner, tmp_path: Path
+) -> None:
+    db = tmp_path / "docdb.sqlite"
+    note = tmp_path / "x.md"
+    note.write_text("# X\n本文", encoding="utf-8")
+    runner.invoke(
+        main,
+        ["--db", str(db), "ingest", str(note)],
+        obj={"llm_factory": _factory(ExtractionResult(title="X"))},
+    )
+
+    def cached() -> int:
+        c = sqlite3.connect(db)
+        try:
+            return c.execute("SELECT COUNT(*) FROM embedding_cache").fetchone()[0]
+        finally:
+            c.close()
+
+    assert cached() > 0
+    result = runner.invoke(main, ["--db", str(db), "clear-embed-cache"])
+
+    assert result.exit_code == 0, result.output
+    assert "removed" in result.output
+    assert cached() == 0
+
+
+def test_ingest_caps_the_ingest_cache_like_ingest_dir(
+    runner: CliRunner, tmp_path: Path
+) -> None:
+    db = tmp_path / "docdb.sqlite"
+    settings = Settings(_env_file=None, db_path=db, ingest_embed_cache_rows=1)
+    for name in ("a", "b"):
+        note = tmp_path / f"{name}.md"
+        note.write_text(f"# {name}\n本文{name}", encoding="utf-8")
+        result = runner.invoke(
+            main,
+            ["ingest", str(note)],
+            obj={
+                "settings": settings,
+                "llm_factory": _factory(ExtractionResult(title=name)),
+            },
+        )
+        assert result.exit_code == 0, result.output
+
+    c = sqlite3.connect(db)
+    try:
+        assert c.execute("SELECT COUNT(*) FROM embedding_cache").fetchone()[0] == 1
+    finally:
+        c.close()
+
+
 def test_search_against_empty_db_prints_no_results_message(
     runner: CliRunner, tmp_path: Path
 ) -> None:
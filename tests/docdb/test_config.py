@@ -55,3 +55,32 @@ def test_query_resolution_env_overrides(monkeypatch) -> None:
     assert s.query_resolution_enabled is False
     assert s.query_resolution_top_k == 25
     assert s.query_resolution_distance == 0.7
+
+
+def test_embed_cache_namespace_includes_the_embed_server() -> None:
+    from docdb.config import Settings
+
+    shared = Settings(_env_file=None, ollama_base_url="http://a:11434/v1")
+    dedicated = Settings(
+        _env_file=None,
+        ollama_base_url="http://a:11434/v1",
+        embed_base_url="http://b:8080/v1",
+    )
+
+    assert shared.embed_cache_namespace == "bge-m3@http://a:11434/v1"
+    assert dedicated.embed_cache_namespace == "bge-m3@http://b:8080/v1"
+
+
+def test_embed_cache_namespace_spells_one_server_one_way() -> None:
+    from docdb.config import Settings
+
+    spellings = [
+        "http://localhost:11434",
+        "http://127.0.0.1:11434/",
+        "HTTP://LocalHost:11434",
+    ]
+    namespaces = {
+        Settings(_env_file=None, ollama_base_url=url).embed_cache_namespace
+        for url in spellings
+    }
+    assert namespaces == {"bge-m3@http://127.0.0.1:11434"}
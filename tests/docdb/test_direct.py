@@ -15,11 +15,20 @@ from __future__ import annotations
 import pytest
 
 from docdb.ingestion.store import DocumentStore
-from docdb.models import Entity, entity_id_for
+from docdb.models import (
+    Document,
+    Entity,
+    content_hash_for,
+    document_id_for,
+    entity_id_for,
+)
 from docdb.search.direct import (
     count_documents,
     find_similar,
+    get_citations,
     get_document,
+    get_document_preview,
+    get_entities,
     get_entity_documents,
     get_recent_documents,
     list_doc_types,
@@ -66,6 +75,62 @@ def test_get_document_returns_none_for_missing_id(populated_db) -> None:
     assert get_document(populated_db, "doc-doesnotexist") is None
 
 
+def test_get_document_preview_matches_model_dump_and_cuts_raw_text(
+    populated_db,
+) -> None:
+    doc = SAMPLE_DOCS[0]
+    full = get_document(populated_db, doc.id).model_dump()
+    preview = get_document_preview(populated_db, doc.id, max_chars=10_000)
+    assert preview == full
+    assert list(preview) == list(full)
+
+    cut = get_document_preview(populated_db, doc.id, max_chars=3)
+    assert cut["raw_text"] == doc.raw_text[:3] + "\n[... truncated ...]"
+    assert get_document_preview(populated_db, "doc-doesnotexist", max_chars=3) is None
+
+
+def test_get_citations_keeps_order_and_drops_unknown_ids(populated_db) -> None:
+    ids = [SAMPLE_DOCS[2].id, "doc-missing", SAMPLE_DOCS[0].id, SAMPLE_DOCS[2].id]
+    cites = get_citations(populated_db, ids)
+
+    assert [c.document_id for c in cites] == [SAMPLE_DOCS[2].id, SAMPLE_DOCS[0].id]
+    assert cites[1].title == SAMPLE_DOCS[0].title
+    assert cites[1].source_path == SAMPLE_DOCS[0].source_path
+    assert cites[1].doc_type == SAMPLE_DOCS[0].doc_type
+    assert get_citations(populated_db, []) == []
+
+
+def test_get_citations_chunks_long_id_lists(populated_db) -> None:
+    # More ids than SQLite binds per statement on older builds (999).
+    padding = [f"doc-missing-{i}" for i in range(1500)]
+    ids = [SAMPLE_DOCS[1].id, *padding, SAMPLE_DOCS[0].id]
+    cites = get_citations(populated_db, ids)
+
+    assert [c.document_id for c in cites] == [SAMPLE_DOCS[1].id, SAMPLE_DOCS[0].id]
+
+
+def test_get_citations_snippet_prefers_summary_then_raw_text(conn) -> None:
+    store = DocumentStore(conn)
+    docs = []
+    for body, summary in (("本文" * 100, "要約"), ("本文のみ" * 100, ""), ("", None)):
+        h = content_hash_for(body or "empty")
+        doc = Document(
+            id=document_id_for(h),
+            source_type="md",
+            content_hash=h,
+            summary=summary,
+            raw_text=body,
+        )
+        store.upsert_document(doc)
+        docs.append(doc)
+
+    cites = get_citations(conn, [d.id for d in docs])
+
+    assert cites[0].snippet == "要約"
+    assert cites[1].snippet == ("本文のみ" * 100)[:160]
+    assert cites[2].snippet is None
+
+
 # ---------------------------------------------------------------------------
 # Full-text search
 # ---------------------------------------------------------------------------
@@ -160,6 +225,21 @@ def test_search_entities_with_type_filter(populated_db) -> None:
     assert {e.canonical_name for e in results} == {"設計レビュー実施"}
 
 
+def test_get_entities_batches_lookup_and_drops_missing(populated_db) -> None:
+    ids = [e.id for e in SAMPLE_ENTITIES]
+    found = get_entities(populated_db, [*ids, "ent-missing", ids[0]])
+    assert set(found) == set(ids)
+    assert found[ids[0]].canonical_name == SAMPLE_ENTITIES[0].canonical_name
+    assert get_entities(populated_db, []) == {}
+
+
+def test_get_entities_chunks_long_id_lists(populated_db) -> None:
+    ids = [e.id for e in SAMPLE_ENTITIES]
+    padding = [f"ent-missing-{i}" for i in range(1500)]
+    found = get_entities(populated_db, [ids[0], *padding, ids[-1]])
+    assert set(found) == {ids[0], ids[-1]}
+
+
 def test_get_entity_documents_returns_linked(populated_db) -> None:
     tanaka = SAMPLE_ENTITIES[0]
     results = get_entity_documents(populated_db, tanaka.id)
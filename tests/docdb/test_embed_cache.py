@@ -0,0 +1,130 @@
+"""Query-embedding cache tests.
+
+``CachedEmbedder`` sits in front of ``LLMProtocol.embed`` on the query
+path. What matters:
+
+* a repeated text is served from the cache without an LLM call
+* only the misses of a mixed batch are forwarded, in one call
+* namespaces (embed model names) never share vectors
+* the LRU bound evicts the least-recently-used entry
+* ``maxsize=0`` disables storage without changing results
+* ``SQLiteEmbeddingCache`` (the ingest-side store) survives across
+  instances and never commits a transaction it did not open
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from docdb.llm import (
+    CachedEmbedder,
+    EmbeddingCache,
+    FakeLLM,
+    LLMProtocol,
+    SQLiteEmbeddingCache,
+)
+
+
+def test_cached_embedder_satisfies_protocol() -> None:
+    assert isinstance(CachedEmbedder(FakeLLM(), EmbeddingCache()), LLMProtocol)
+
+
+def test_repeated_text_hits_cache() -> None:
+    fake = FakeLLM()
+    embedder = CachedEmbedder(fake, EmbeddingCache(), namespace="bge-m3")
+
+    first = embedder.embed(["プロジェクト"])
+    second = embedder.embed(["プロジェクト"])
+
+    assert first == second
+    assert fake.calls_embed == [["プロジェクト"]]
+
+
+def test_only_misses_are_forwarded_in_one_batch() -> None:
+    fake = FakeLLM()
+    embedder = CachedEmbedder(fake, EmbeddingCache())
+    embedder.embed(["a"])
+
+    out = embedder.embed(["b", "a", "c", "b"])
+
+    assert fake.calls_embed == [["a"], ["b", "c"]]
+    assert out == FakeLLM().embed(["b", "a", "c", "b"])
+
+
+def test_namespaces_do_not_share_vectors() -> None:
+    fake = FakeLLM()
+    cache = EmbeddingCache()
+    CachedEmbedder(fake, cache, namespace="model-a").embed(["x"])
+    CachedEmbedder(fake, cache, namespace="model-b").embed(["x"])
+
+    assert fake.calls_embed == [["x"], ["x"]]
+
+
+def test_lru_evicts_least_recently_used() -> None:
+    fake = FakeLLM()
+    embedder = CachedEmbedder(fake, EmbeddingCache(maxsize=2))
+    embedder.embed(["a"])
+    embedder.embed(["b"])
+    embedder.embed(["a"])  # refresh "a"; "b" is now the oldest
+    embedder.embed(["c"])  # evicts "b"
+    fake.calls_embed.clear()
+
+    embedder.embed(["a"])
+    embedder.embed(["b"])
+
+    assert fake.calls_embed == [["b"]]
+
+
+def test_zero_maxsize_disables_cache() -> None:
+    fake = FakeLLM()
+    embedder = CachedEmbedder(fake, EmbeddingCache(maxsize=0))
+    embedder.embed(["a"])
+    embedder.embed(["a"])
+
+    assert fake.calls_embed == [["a"], ["a"]]
+    assert len(embedder.cache) == 0
+
+
+def test_long_texts_sharing_a_prefix_stay_distinct() -> None:
+    fake = FakeLLM()
+    embedder = CachedEmbedder(fake, EmbeddingCache())
+    head = "person: 田中太郎\n" * 200
+    a, b = embedder.embed([head + "a", head + "b"])
+
+    assert a != b
+    assert embedder.embed([head + "b"]) == [b]
+    assert len(fake.calls_embed) == 1
+
+
+def test_sqlite_cache_persists_across_instances(conn) -> None:
+    fake = FakeLLM()
+    CachedEmbedder(fake, SQLiteEmbeddingCache(conn), namespace="bge-m3").embed(["a", "b"])
+
+    again = CachedEmbedder(fake, SQLiteEmbeddingCache(conn), namespace="bge-m3")
+    out = again.embed(["b", "c", "a"])
+
+    assert fake.calls_embed == [["a", "b"], ["c"]]
+    # Stored as float32, like the vec0 tables.
+    for got, want in zip(out, FakeLLM().embed(["b", "c", "a"])):
+        assert got == pytest.approx(want, abs=1e-6)
+    assert len(again.cache) == 3
+
+
+def test_sqlite_cache_lookups_never_write(conn) -> None:
+    cache = SQLiteEmbeddingCache(conn)
+    cache.put("m", "x", [0.5] * 4)
+    before = conn.total_changes
+
+    assert cache.get_many("m", ["x", "y"])[0] is not None
+
+    assert conn.total_changes == before
+    assert not conn.in_transaction
+
+
+def test_sqlite_cache_joins_an_open_transaction(conn) -> None:
+    cache = SQLiteEmbeddingCache(conn)
+    conn.execute("BEGIN")
+    cache.put("m", "x", [0.5] * 4)
+    conn.rollback()
+
+    assert cache.get("m", "x") is None
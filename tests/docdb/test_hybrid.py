@@ -18,7 +18,8 @@ from __future__ import annotations
 import pytest
 
 from docdb.llm.fake import FakeLLM
-from docdb.search.hybrid import hybrid_search
+from docdb.models import Citation
+from docdb.search.hybrid import _rrf_fuse, hybrid_search
 
 from tests.docdb.fixtures import SAMPLE_DOCS
 
@@ -86,6 +87,21 @@ def test_fused_score_is_descending(populated_db, embedder: FakeLLM) -> None:
     assert scores == sorted(scores, reverse=True)
 
 
+def test_arm_weights_shift_the_fused_ranking() -> None:
+    fts = [Citation(document_id="a"), Citation(document_id="b")]
+    vec = [Citation(document_id="b"), Citation(document_id="c")]
+
+    plain = _rrf_fuse(fts, vec, top_k=3, rrf_k=60)
+    assert plain[0].document_id == "b"  # in both arms
+
+    fts_only = _rrf_fuse(fts, vec, top_k=3, rrf_k=60, vec_weight=0.0)
+    assert [c.document_id for c in fts_only] == ["a", "b", "c"]
+
+    vec_only = _rrf_fuse(fts, vec, top_k=3, rrf_k=60, fts_weight=0.0)
+    assert [c.document_id for c in vec_only] == ["b", "c", "a"]
+    assert vec_only[-1].score == 0.0
+
+
 # ---------------------------------------------------------------------------
 # Filters
 # ---------------------------------------------------------------------------
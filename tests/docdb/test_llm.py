@@ -215,6 +215,75 @@ def test_chat_with_tools_forwards_num_ctx_and_keep_alive(monkeypatch) -> None:
     assert captured["model"] == llm.settings.agent_model
 
 
+def test_embed_splits_inputs_into_batches(monkeypatch) -> None:
+    from docdb.config import Settings
+
+    llm = LLM(Settings(embed_batch_size=2))
+    batches: list[list[str]] = []
+
+    def _spy(**kwargs):
+        batches.append(list(kwargs["input"]))
+        return SimpleNamespace(
+            data=[SimpleNamespace(embedding=[float(len(t))]) for t in kwargs["input"]]
+        )
+
+    monkeypatch.setattr(llm._openai.embeddings, "create", _spy)
+    vectors = llm.embed(["a", "bb", "ccc", "dddd", "eeeee"])
+
+    assert batches == [["a", "bb"], ["ccc", "dddd"], ["eeeee"]]
+    assert vectors == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+    assert llm.embed([]) == []
+
+
+def test_embed_base_url_routes_embeddings_to_dedicated_client(monkeypatch) -> None:
+    from docdb.config import Settings
+
+    llm = LLM(Settings(embed_base_url="http://localhost:8081/v1"))
+    assert llm._embed_openai is not llm._openai
+    seen: list[dict] = []
+
+    def _spy(**kwargs):
+        seen.append(kwargs)
+        return SimpleNamespace(data=[SimpleNamespace(embedding=[0.5])])
+
+    monkeypatch.setattr(llm._embed_openai.embeddings, "create", _spy)
+    assert llm.embed(["x"]) == [[0.5]]
+    # Ollama-only ``keep_alive`` is not sent to a foreign server.
+    assert seen[0]["extra_body"] is None
+
+
+def test_concurrent_first_use_builds_one_client(monkeypatch) -> None:
+    import threading
+    import time
+
+    from docdb.llm import client as client_module
+
+    built: list[object] = []
+
+    class _SlowOpenAI:
+        def __init__(self, **kwargs):
+            time.sleep(0.01)  # widen the race window
+            built.append(self)
+
+    monkeypatch.setattr(client_module, "OpenAI", _SlowOpenAI)
+    llm = LLM()
+    start = threading.Barrier(8)
+    seen: list[object] = []
+
+    def _first_use():
+        start.wait()
+        seen.append(llm._embed_openai)
+
+    threads = [threading.Thread(target=_first_use) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(built) == 1
+    assert all(c is built[0] for c in seen)
+
+
 def test_to_native_message_unstrings_assistant_tool_call_arguments() -> None:
     # Shape that ``docdb.agent.loop`` builds when echoing a previous
     # assistant turn back into the next chat call (loop.py:114-130).
@@ -20,7 +20,7 @@ from pathlib import Path
 
 import pytest
 
-from docdb.ingestion.parser import Parser, ParsedDocument, Section
+from docdb.ingestion.parser import Parser, ParsedDocument, Section, source_type_for
 
 
 @pytest.fixture
@@ -50,6 +50,33 @@ def test_parse_markdown_keeps_preamble(parser: Parser) -> None:
     assert doc.sections[1].header == "章"
 
 
+def test_parse_markdown_ignores_hashes_inside_code_fences(parser: Parser) -> None:
+    text = (
+        "# 手順\n"
+        "```bash\n# コメント\n````\n"  # longer run of the same char closes
+        "## 次\n"
+        "~~~\n# まだコード\n```\n# 閉じていない\n~~~\n"
+        "本文\n"
+    )
+    doc = parser.parse_markdown(text, source_path="memo/x.md")
+
+    assert [s.header for s in doc.sections] == ["手順", "次"]
+    assert "# コメント" in doc.sections[0].body
+    assert "# 閉じていない" in doc.sections[1].body
+
+
+def test_parse_markdown_inline_triple_backticks_do_not_open_a_fence(
+    parser: Parser,
+) -> None:
+    # A backtick fence's info string cannot contain backticks, so this
+    # line is inline code and the heading after it still splits.
+    text = "# 手順\n```inline```\n## 次\n本文\n"
+    doc = parser.parse_markdown(text, source_path="memo/x.md")
+
+    assert [s.header for s in doc.sections] == ["手順", "次"]
+    assert doc.sections[0].body == "```inline```"
+
+
 def test_parse_markdown_extracts_yaml_frontmatter(parser: Parser) -> None:
     text = (
         "---\n"
@@ -168,3 +195,10 @@ def test_parsed_document_is_a_dataclass_with_expected_fields(parser: Parser) ->
     assert isinstance(doc, ParsedDocument)
     assert isinstance(doc.sections[0], Section)
     assert doc.body_without_frontmatter == "# H\n本文"
+
+
+def test_source_type_for_accepts_str_and_path() -> None:
+    assert source_type_for("notes/Memo.MARKDOWN") == "md"
+    assert source_type_for(Path("slides/deck.pptx")) == "pptx"
+    assert source_type_for("README") == "txt"
+    assert source_type_for("notes/.md") == "txt"  # dotfile, not a suffix
@@ -15,7 +15,7 @@ from pathlib import Path
 
 import pytest
 
-from docdb.ingestion.pipeline import IngestionPipeline
+from docdb.ingestion.pipeline import IngestionPipeline, iter_source_files
 from docdb.ingestion.store import DocumentStore
 from docdb.llm.fake import FakeLLM
 from docdb.models import ExtractionResult
@@ -139,6 +139,37 @@ def test_editing_a_file_replaces_old_rows_and_returns_updated(conn) -> None:
     assert titles == ["新"]
 
 
+def test_ingest_file_skips_unchanged_stat_without_reading(conn, tmp_path: Path) -> None:
+    import os
+
+    path = tmp_path / "a.md"
+    path.write_text("# A\n本文A", encoding="utf-8")
+    pipeline, fake = _make_pipeline(
+        conn, results=[ExtractionResult(title="A"), ExtractionResult(title="B")]
+    )
+    first = pipeline.ingest_file(path)
+    assert first.status == "created"
+
+    # Same size, restored mtime: the stat matches, so the edit goes unseen —
+    # proof that the file was neither read nor hashed.
+    st = path.stat()
+    path.write_text("# B\n本文B", encoding="utf-8")
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    second = pipeline.ingest_file(path)
+    assert second.status == "skipped"
+    assert second.document_id == first.document_id
+    assert len(fake.calls_extract) == 1
+
+    # A new mtime forces the read; the changed content is picked up.
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    third = pipeline.ingest_file(path)
+    assert third.status == "updated"
+    row = conn.execute(
+        "SELECT document_id FROM source_files WHERE source_path = ?", (str(path),)
+    ).fetchone()
+    assert row["document_id"] == third.document_id
+
+
 # ---------------------------------------------------------------------------
 # Directory walk
 # ---------------------------------------------------------------------------
@@ -159,6 +190,204 @@ def test_ingest_directory_processes_every_markdown_file(conn, tmp_path: Path) ->
     assert conn.execute("SELECT COUNT(*) AS n FROM documents").fetchone()["n"] == 3
 
 
+def test_ingest_files_with_extract_workers_matches_sequential_order(
+    conn, tmp_path: Path
+) -> None:
+    for name in ("a", "b", "c"):
+        (tmp_path / f"{name}.md").write_text(f"# {name}\n本文{name}", encoding="utf-8")
+    # Same content as a.md, read while a.md's extraction is still in
+    # flight: it must still come back as a content-hash skip.
+    (tmp_path / "dup.md").write_text("# a\n本文a", encoding="utf-8")
+    paths = [tmp_path / n for n in ("a.md", "dup.md", "b.md", "c.md")]
+
+    fake = FakeLLM()
+    pipeline = IngestionPipeline(
+        store=DocumentStore(conn), llm=fake, extract_workers=3
+    )
+    reports = list(pipeline.ingest_files(paths))
+
+    assert [r.source_path for r in reports] == [str(p) for p in paths]
+    assert [r.status for r in reports] == ["created", "skipped", "created", "created"]
+    assert reports[1].document_id == reports[0].document_id
+    assert conn.execute("SELECT COUNT(*) AS n FROM documents").fetchone()["n"] == 3
+    assert conn.execute("SELECT COUNT(*) AS n FROM source_files").fetchone()["n"] == 4
+
+
+def test_ingest_files_with_extract_workers_reingests_copy_of_replaced_content(
+    conn, tmp_path: Path
+) -> None:
+    a = tmp_path / "a.md"
+    a.write_text("# a\n古い本文", encoding="utf-8")
+    pipeline = IngestionPipeline(
+        store=DocumentStore(conn), llm=FakeLLM(), extract_workers=2
+    )
+    [old] = pipeline.ingest_files([a])
+
+    # b.md holds a.md's old content and has no source_files row yet. Its
+    # hash check matches a.md's old document, which a.md's update (queued
+    # ahead of it) then deletes.
+    a.write_text("# a\n新しい本文です", encoding="utf-8")
+    b = tmp_path / "b.md"
+    b.write_text("# a\n古い本文", encoding="utf-8")
+    reports = list(pipeline.ingest_files([a, b]))
+
+    assert [r.status for r in reports] == ["updated", "created"]
+    assert reports[1].document_id == old.document_id
+    rows = conn.execute(
+        "SELECT source_path, document_id FROM source_files ORDER BY source_path"
+    ).fetchall()
+    assert [(r["source_path"], r["document_id"]) for r in rows] == [
+        (str(a), reports[0].document_id),
+        (str(b), reports[1].document_id),
+    ]
+
+
+def test_ingest_files_read_ahead_skips_unchanged_and_reports_read_errors(
+    conn, tmp_path: Path
+) -> None:
+    for name in ("a", "b", "c"):
+        (tmp_path / f"{name}.md").write_text(f"# {name}\n本文{name}", encoding="utf-8")
+    paths = [tmp_path / n for n in ("a.md", "missing.md", "b.md", "c.md")]
+    pipeline = IngestionPipeline(store=DocumentStore(conn), llm=FakeLLM(), read_ahead=2)
+
+    first = list(pipeline.ingest_files(paths))
+    assert [r.status for r in first] == ["created", "error", "created", "created"]
+
+    second = list(pipeline.ingest_files(paths))
+    assert [r.status for r in second] == ["skipped", "error", "skipped", "skipped"]
+    assert [r.document_id for r in second] == [r.document_id for r in first]
+
+
+# 4 is Settings.ingest_read_ahead's default, i.e. the usual ingest-dir path.
+@pytest.mark.parametrize("read_ahead", [0, 4])
+def test_ingest_files_read_ahead_rereads_file_whose_stat_row_was_replaced(
+    conn, tmp_path: Path, read_ahead: int
+) -> None:
+    a = tmp_path / "a.md"
+    b = tmp_path / "b.md"
+    a.write_text("# a\n古い本文", encoding="utf-8")
+    b.write_text("# a\n古い本文", encoding="utf-8")
+    pipeline = IngestionPipeline(
+        store=DocumentStore(conn), llm=FakeLLM(), read_ahead=read_ahead
+    )
+    first = list(pipeline.ingest_files([a, b]))
+    assert [r.status for r in first] == ["created", "skipped"]
+
+    # b.md's stat row points at a.md's document, which a.md's update
+    # replaces after b.md's stat check has already passed.
+    a.write_text("# a\n新しい本文です", encoding="utf-8")
+    second = list(pipeline.ingest_files([a, b]))
+
+    assert [r.status for r in second] == ["updated", "created"]
+    assert second[1].document_id == first[0].document_id
+    for report in second:
+        row = conn.execute(
+            "SELECT document_id FROM source_files WHERE source_path = ?",
+            (report.source_path,),
+        ).fetchone()
+        assert row["document_id"] == report.document_id
+
+
+@pytest.mark.parametrize("extract_workers, read_ahead", [(2, 0), (1, 4), (3, 2)])
+def test_ingest_files_redoes_skip_whose_document_was_cascade_deleted(
+    conn, tmp_path: Path, extract_workers: int, read_ahead: int
+) -> None:
+    a = tmp_path / "a.md"
+    b = tmp_path / "b.md"
+    a.write_text("# a\n古い本文", encoding="utf-8")
+    b.write_text("# a\n古い本文", encoding="utf-8")
+    pipeline = IngestionPipeline(
+        store=DocumentStore(conn),
+        llm=FakeLLM(),
+        extract_workers=extract_workers,
+        read_ahead=read_ahead,
+    )
+    first = list(pipeline.ingest_files([a, b]))
+    assert [r.status for r in first] == ["created", "skipped"]
+
+    stat_row_at_start: dict[str, str | None] = {}
+
+    def on_start(source_path: str) -> None:
+        row = conn.execute(
+            "SELECT document_id FROM source_files WHERE source_path = ?",
+            (source_path,),
+        ).fetchone()
+        stat_row_at_start[source_path] = row["document_id"] if row else None
+
+    a.write_text("# a\n新しい本文です", encoding="utf-8")
+    second = list(pipeline.ingest_files([a, b], on_start=on_start))
+
+    # b.md was queued as a stat skip against a.md's old document. a.md's
+    # update deleted that document, and ON DELETE CASCADE took b.md's
+    # source_files row with it before b.md was completed.
+    assert stat_row_at_start[str(b)] is None
+    assert [r.status for r in second] == ["updated", "created"]
+    assert second[1].document_id == first[0].document_id
+    assert conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0] == 2
+
+
+@pytest.mark.parametrize("extract_workers, read_ahead", [(1, 0), (3, 2)])
+def test_ingest_files_announces_each_path_before_its_report(
+    conn, tmp_path: Path, extract_workers: int, read_ahead: int
+) -> None:
+    for name in ("a", "b", "c"):
+        (tmp_path / f"{name}.md").write_text(f"# {name}\n本文{name}", encoding="utf-8")
+    paths = [tmp_path / n for n in ("a.md", "missing.md", "b.md", "c.md")]
+    pipeline = IngestionPipeline(
+        store=DocumentStore(conn),
+        llm=FakeLLM(),
+        extract_workers=extract_workers,
+        read_ahead=read_ahead,
+    )
+
+    events: list[tuple[str, str]] = []
+    for report in pipeline.ingest_files(
+        paths, on_start=lambda p: events.append(("start", p))
+    ):
+        events.append(("done", report.source_path))
+
+    assert events == [
+        (kind, str(p)) for p in paths for kind in ("start", "done")
+    ]
+
+
+def test_iter_source_files_walks_recursively_and_sorts(tmp_path: Path) -> None:
+    (tmp_path / "b.md").write_text("b", encoding="utf-8")
+    (tmp_path / "a.md").write_text("a", encoding="utf-8")
+    (tmp_path / "sub" / "deeper").mkdir(parents=True)
+    (tmp_path / "sub" / "deeper" / "c.md").write_text("c", encoding="utf-8")
+    (tmp_path / "sub" / "skip.txt").write_text("x", encoding="utf-8")
+    (tmp_path / "dir.md").mkdir()  # a directory that matches the pattern
+
+    fast = iter_source_files(tmp_path, "**/*.md")
+    assert fast == sorted(p for p in tmp_path.glob("**/*.md") if p.is_file())
+    assert [p.name for p in fast] == ["a.md", "b.md", "c.md"]
+
+    # Non-recursive patterns go through Path.glob.
+    assert iter_source_files(tmp_path, "*.md") == [tmp_path / "a.md", tmp_path / "b.md"]
+
+
+def test_iter_source_files_matches_glob_for_symlinks(tmp_path: Path) -> None:
+    real = tmp_path / "real"
+    real.mkdir()
+    (real / "a.md").write_text("a", encoding="utf-8")
+    (tmp_path / "elsewhere").mkdir()
+    (tmp_path / "elsewhere" / "b.md").write_text("b", encoding="utf-8")
+    try:
+        (real / "link").symlink_to(tmp_path / "elsewhere", target_is_directory=True)
+        (real / "loop").symlink_to(real, target_is_directory=True)
+        (real / "alias.md").symlink_to(real / "a.md")
+    except (OSError, NotImplementedError):
+        pytest.skip("symlinks not supported here")
+
+    found = iter_source_files(real, "**/*.md")
+
+    # Symlinked directories are not descended into (as with Path.glob);
+    # symlinks to files still match.
+    assert found == sorted(p for p in real.glob("**/*.md") if p.is_file())
+    assert [p.name for p in found] == ["a.md", "alias.md"]
+
+
 # ---------------------------------------------------------------------------
 # Graceful degradation
 # ---------------------------------------------------------------------------
@@ -208,6 +437,7 @@ def test_extraction_failure_still_writes_document(conn) -> None:
 # ---------------------------------------------------------------------------
 import json
 
+from docdb.llm import CachedEmbedder, SQLiteEmbeddingCache
 from docdb.typing.dynamic_model import build_extraction_model, clear_cache
 from docdb.typing.registry import registry_hash
 
@@ -394,6 +624,35 @@ def test_dedup_disabled_skips_lookup(conn) -> None:
     assert n == 2
 
 
+def test_reingest_reuses_cached_entity_vectors(conn) -> None:
+    """Editing a note must not re-embed entities whose embed text is
+    unchanged, with the LLM wrapped the way the CLI and server wrap it."""
+    edited = _person_extraction(conn, "Alice")
+    # A new title changes the document's embed text, so exactly the
+    # document embed misses the cache on re-ingest.
+    edited.title = "doc about Alice (edited)"
+    llm = _KeyedEmbedLLM(
+        extract_responses=[_person_extraction(conn, "Alice"), edited],
+    )
+    pipeline = IngestionPipeline(
+        store=DocumentStore(conn),
+        llm=CachedEmbedder(llm, SQLiteEmbeddingCache(conn), namespace="bge-m3"),
+    )
+
+    pipeline.ingest_text("v1 body", source_path="a.md")
+    assert ["person: Alice"] in llm.calls_embed
+    llm.calls_embed.clear()
+
+    report = pipeline.ingest_text("v2 body", source_path="a.md")
+
+    assert report.status == "updated"
+    assert report.entities_added_by_type.get("person") == 1
+    embedded = [t for call in llm.calls_embed for t in call]
+    assert "person: Alice" not in embedded
+    assert len(llm.calls_embed) == 1  # the document embed only
+    assert "doc about Alice (edited)" in llm.calls_embed[0][0]
+
+
 def test_embed_failure_falls_back_to_no_dedup(conn) -> None:
     """If entity-batch embed raises, the doc still ingests and the
     failure lands on extraction_error. Doc embed (call #1) succeeds."""
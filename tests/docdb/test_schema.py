@@ -12,6 +12,7 @@ Text2SQL, ingestion) relies on:
 from __future__ import annotations
 
 import sqlite3
+import time
 
 import pytest
 
@@ -30,6 +31,8 @@ EXPECTED_TABLES = {
     "document_tags",
     "document_relations",
     "extraction_runs",
+    "source_files",
+    "embedding_cache",
 }
 
 EXPECTED_VIRTUAL_TABLES = {
@@ -70,6 +73,91 @@ def test_init_db_is_idempotent(db_path) -> None:
     assert count == 1
 
 
+def test_connection_enables_memory_mapped_io(conn: sqlite3.Connection) -> None:
+    from docdb.schema.connection import _MMAP_SIZE
+
+    # SQLite may clamp to SQLITE_MAX_MMAP_SIZE but never silently disables
+    # mmap on a default build.
+    (mmap_size,) = conn.execute("PRAGMA mmap_size").fetchone()
+    assert 0 < mmap_size <= _MMAP_SIZE
+
+
+def test_finish_bulk_write_truncates_the_wal(conn: sqlite3.Connection, db_path) -> None:
+    from docdb.schema.connection import finish_bulk_write
+
+    with conn:
+        conn.execute(
+            "INSERT INTO documents(id, source_type, content_hash) VALUES (?, ?, ?)",
+            ("d-wal", "md", "h-wal"),
+        )
+    wal = db_path.with_name(db_path.name + "-wal")
+    assert wal.stat().st_size > 0
+
+    finish_bulk_write(conn)
+
+    assert wal.stat().st_size == 0
+    assert conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0] == 1
+
+
+def test_finish_bulk_write_passive_checkpoint_does_not_wait_for_readers(
+    conn: sqlite3.Connection, db_path
+) -> None:
+    from docdb.schema.connection import connection, finish_bulk_write
+
+    with conn:
+        conn.execute(
+            "INSERT INTO documents(id, source_type, content_hash) VALUES (?, ?, ?)",
+            ("d-wal", "md", "h-wal"),
+        )
+    with connection(db_path, readonly=True) as reader:
+        reader.execute("BEGIN")
+        reader.execute("SELECT COUNT(*) FROM documents").fetchone()
+        started = time.monotonic()
+        finish_bulk_write(conn, checkpoint="PASSIVE")
+        # TRUNCATE would sit in the busy handler (5s) waiting on the reader.
+        assert time.monotonic() - started < 1.0
+        reader.execute("COMMIT")
+
+
+def test_finish_bulk_write_keeps_the_newest_embeddings(conn: sqlite3.Connection) -> None:
+    from docdb.schema.connection import finish_bulk_write
+
+    with conn:
+        conn.executemany(
+            "INSERT INTO embedding_cache(namespace, text_hash, embedding) VALUES (?, ?, ?)",
+            [("old-model", b"a", b"\0"), ("bge-m3", b"a", b"\0"), ("bge-m3", b"b", b"\0")],
+        )
+        # Re-storing a text moves it to the newest end.
+        conn.execute(
+            "INSERT OR REPLACE INTO embedding_cache(namespace, text_hash, embedding)"
+            " VALUES (?, ?, ?)",
+            ("old-model", b"a", b"\0"),
+        )
+
+    finish_bulk_write(conn, embed_cache_rows=2)
+
+    rows = conn.execute("SELECT namespace, text_hash FROM embedding_cache ORDER BY rowid")
+    assert [tuple(r) for r in rows] == [("bge-m3", b"b"), ("old-model", b"a")]
+
+
+def test_finish_bulk_write_leaves_the_callers_transaction_open(
+    conn: sqlite3.Connection,
+) -> None:
+    from docdb.schema.connection import finish_bulk_write
+
+    conn.execute(
+        "INSERT INTO documents(id, source_type, content_hash) VALUES (?, ?, ?)",
+        ("d-open", "md", "h-open"),
+    )
+    assert conn.in_transaction
+
+    finish_bulk_write(conn, embed_cache_rows=0)
+
+    assert conn.in_transaction
+    conn.rollback()
+    assert conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0] == 0
+
+
 def test_documents_content_hash_is_unique(conn: sqlite3.Connection) -> None:
     conn.execute(
         "INSERT INTO documents(id, source_type, content_hash) VALUES (?, ?, ?)",
@@ -125,6 +125,17 @@ def test_destructive_or_meta_statements_are_rejected(sql: str) -> None:
         validate_readonly_sql(sql, allowed_tables=ALLOWED)
 
 
+def test_forbidden_type_is_named_in_list_order_not_walk_order() -> None:
+    # The walk reaches the DELETE first; INSERT is listed ahead of it.
+    sql = (
+        "WITH d AS (DELETE FROM documents RETURNING id), "
+        "i AS (INSERT INTO tags(name) VALUES ('x') RETURNING id) "
+        "SELECT * FROM d, i"
+    )
+    with pytest.raises(UnsafeQueryError, match="forbidden statement type: Insert$"):
+        validate_readonly_sql(sql, allowed_tables=ALLOWED)
+
+
 def test_multi_statement_string_is_rejected() -> None:
     with pytest.raises(UnsafeQueryError, match="multiple"):
         validate_readonly_sql(
@@ -106,6 +106,19 @@ def test_delete_by_source_removes_matching_documents(conn) -> None:
     assert [r["source_path"] for r in remaining] == ["data/y.md"]
 
 
+def test_delete_by_source_drops_vectors_of_deleted_documents(conn) -> None:
+    store = DocumentStore(conn)
+    gone = _make_doc("a", source_path="data/x.md")
+    kept = _make_doc("c", source_path="data/y.md")
+    store.upsert_document(gone, embedding=[0.1] * 1024)
+    store.upsert_document(kept, embedding=[0.2] * 1024)
+
+    assert store.delete_by_source("data/x.md") == 1
+    assert store.delete_by_source("data/missing.md") == 0
+    ids = [r["document_id"] for r in conn.execute("SELECT document_id FROM documents_vec")]
+    assert ids == [kept.id]
+
+
 # ---------------------------------------------------------------------------
 # Entities (property-graph nodes)
 # ---------------------------------------------------------------------------
@@ -343,6 +356,83 @@ def test_link_document_entity_and_tag_are_idempotent(conn) -> None:
     assert dt["source"] == "llm"
 
 
+def test_batch_links_match_single_row_upserts(conn) -> None:
+    from docdb.ingestion.normalizer import DocumentEntityLink, DocumentTagLink
+
+    store = DocumentStore(conn)
+    doc = _make_doc("batch")
+    store.upsert_document(doc)
+    e = Entity(id=entity_id_for("org", "Y"), type_slug="org", canonical_name="Y")
+    t = Tag(id=tag_id_for("tag2"), canonical_name="tag2")
+    store.upsert_entity(e)
+    store.upsert_tag(t)
+
+    # Later rows for the same key win, exactly as repeated single upserts.
+    store.link_document_entities(
+        [
+            DocumentEntityLink(doc.id, e.id, mention_count=1),
+            DocumentEntityLink(doc.id, e.id, mention_count=4, contexts=["ctx"]),
+        ]
+    )
+    store.link_document_tags([DocumentTagLink(doc.id, t.id, confidence=0.7)])
+    store.link_document_tags([])
+
+    de = conn.execute(
+        "SELECT mention_count, contexts FROM document_entities WHERE document_id=?",
+        (doc.id,),
+    ).fetchall()
+    assert [(r["mention_count"], json.loads(r["contexts"])) for r in de] == [(4, ["ctx"])]
+    dt = conn.execute(
+        "SELECT confidence FROM document_tags WHERE document_id=?", (doc.id,)
+    ).fetchone()
+    assert dt["confidence"] == pytest.approx(0.7)
+
+
+# ---------------------------------------------------------------------------
+# Transactions
+# ---------------------------------------------------------------------------
+def test_transaction_commits_batch_once_and_rolls_back_on_error(conn) -> None:
+    store = DocumentStore(conn)
+    with store.transaction():
+        store.upsert_document(_make_doc("a"))
+        store.upsert_document(_make_doc("b"))
+        # Nested writes join the outer transaction instead of committing.
+        assert conn.in_transaction
+    assert not conn.in_transaction
+    assert conn.execute("SELECT COUNT(*) AS n FROM documents").fetchone()["n"] == 2
+
+    with pytest.raises(RuntimeError):
+        with store.transaction():
+            store.upsert_document(_make_doc("c"))
+            raise RuntimeError("boom")
+    assert conn.execute("SELECT COUNT(*) AS n FROM documents").fetchone()["n"] == 2
+
+
+def test_type_lookups_are_memoised_only_within_a_transaction(conn, monkeypatch) -> None:
+    import docdb.ingestion.store as store_mod
+
+    calls: list[str] = []
+    real = store_mod.get_entity_type
+
+    def _counting(c, slug):
+        calls.append(slug)
+        return real(c, slug)
+
+    monkeypatch.setattr(store_mod, "get_entity_type", _counting)
+    store = DocumentStore(conn)
+    with store.transaction():
+        for name in ("A", "B", "C"):
+            store.upsert_entity(
+                Entity(id=entity_id_for("org", name), type_slug="org", canonical_name=name)
+            )
+    assert calls == ["org"]
+
+    # Outside a transaction every call re-reads the registry.
+    store.upsert_entity(Entity(id=entity_id_for("org", "D"), type_slug="org", canonical_name="D"))
+    store.upsert_entity(Entity(id=entity_id_for("org", "E"), type_slug="org", canonical_name="E"))
+    assert calls == ["org", "org", "org"]
+
+
 # ---------------------------------------------------------------------------
 # Pack helpers
 # ---------------------------------------------------------------------------
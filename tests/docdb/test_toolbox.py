@@ -67,6 +67,16 @@ def test_search_documents_hybrid_false_skips_embed(populated_db) -> None:
     assert embedder.calls_embed == []
 
 
+def test_search_documents_repeat_is_served_from_cache(populated_db) -> None:
+    embedder = FakeLLM()
+    tb = Toolbox(populated_db, FakeLLM(), embedder=embedder)
+    first = tb.invoke("search_documents", {"query": "プロジェクト", "top_k": 3})
+    # Whitespace-only differences normalise to the same cache key.
+    second = tb.invoke("search_documents", {"query": " プロジェクト ", "top_k": 3})
+    assert first.result == second.result
+    assert embedder.calls_embed == [["プロジェクト"]]
+
+
 def test_search_documents_falls_back_to_fts_when_embed_fails(populated_db) -> None:
     class _ExplodingEmbedder(FakeLLM):
         def embed(self, texts):
@@ -132,6 +142,16 @@ def test_get_document_returns_truncated_raw_text(populated_db) -> None:
     assert len(inv.result["raw_text"]) < 3000
 
 
+def test_get_document_payload_matches_model_dump(toolbox: Toolbox) -> None:
+    from docdb.search import direct
+
+    doc = direct.get_document(toolbox.conn, SAMPLE_DOCS[0].id)
+    inv = toolbox.invoke("get_document", {"document_id": doc.id})
+    assert inv.succeeded
+    assert inv.result == doc.model_dump()
+    assert list(inv.result) == list(doc.model_dump())
+
+
 def test_get_document_missing_returns_none(toolbox: Toolbox) -> None:
     inv = toolbox.invoke("get_document", {"document_id": "doc-missing"})
     assert inv.succeeded
@@ -274,6 +294,32 @@ def test_text_to_sql_surfaces_sqlite_error(populated_db) -> None:
     assert "sqlite error" in inv.result["error"]
 
 
+def test_text_to_sql_fetches_type_registry_once_per_run(
+    populated_db, monkeypatch
+) -> None:
+    from docdb.agent import toolbox as toolbox_mod
+
+    calls: list[int] = []
+    real = toolbox_mod.fetch_type_registry
+
+    def _spy(conn):
+        calls.append(1)
+        return real(conn)
+
+    monkeypatch.setattr(toolbox_mod, "fetch_type_registry", _spy)
+    llm = FakeLLM(
+        extract_responses=[
+            GeneratedSQL(sql="SELECT id FROM documents"),
+            GeneratedSQL(sql="SELECT id FROM documents"),
+        ]
+    )
+    tb = Toolbox(populated_db, llm, query_resolution_enabled=False)
+    tb.invoke("text_to_sql", {"question": "a"})
+    tb.invoke("text_to_sql", {"question": "b"})
+
+    assert calls == [1]
+
+
 # ---------------------------------------------------------------------------
 # Dispatch failure modes
 # ---------------------------------------------------------------------------
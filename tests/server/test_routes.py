@@ -326,3 +326,19 @@ def test_ingest_file(client, tmp_path: Path, fake_llm):
     body = res.get_json()
     assert body["summary"]["created"] == 1
     assert body["reports"][0]["status"] == "created"
+
+
+def test_llm_is_built_once_per_app(seeded_db):
+    from docdb.llm.fake import FakeLLM
+    from server.app import create_app
+
+    built: list[FakeLLM] = []
+
+    def _factory(_settings):
+        built.append(FakeLLM())
+        return built[-1]
+
+    client = create_app(settings=seeded_db, llm_factory=_factory).test_client()
+    assert client.post("/api/search", json={"query": "x", "hybrid": True}).status_code == 200
+    assert client.post("/api/search", json={"query": "y", "hybrid": True}).status_code == 200
+    assert len(built) == 1